@@ -15,6 +15,8 @@ from .pyproject_updater import PyprojectUpdater, RuleFormat
 from .rules_cache_manager import RulesCacheManager
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .rule import Rules
 
 # Configure logging
@@ -318,15 +320,19 @@ Examples:
     return parser
 
 
-def main() -> int:
+def main(*, argv: Sequence[str] | None = None) -> int:
     """Run the pylint-ruff-sync tool.
 
+    Args:
+        argv: Command line arguments, excluding the program name.
+            Defaults to sys.argv[1:].
+
     Returns:
         Exit code (0 for success, non-zero for failure).
 
     """
     parser = _setup_argument_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     _setup_logging(verbose=args.verbose)
 
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .rule import Rules
 
 # Configure logging
@@ -293,6 +295,41 @@ class PylintCleaner:
 
         return None
 
+    def _build_useless_lookup(self, *, useless_rules: Iterable[str]) -> set[str]:
+        """Build a lookup set of useless rule identifiers and their pylint IDs.
+
+        Args:
+            useless_rules: Useless rule identifiers (codes or names).
+
+        Returns:
+            Set holding every useless identifier plus the pylint ID it resolves to.
+
+        """
+        lookup = set(useless_rules)
+        for useless_rule in tuple(lookup):
+            useless_rule_obj = self.rules.get_by_identifier(identifier=useless_rule)
+            if useless_rule_obj:
+                lookup.add(useless_rule_obj.pylint_id)
+        return lookup
+
+    def _is_rule_in_lookup(self, *, rule: str, lookup: set[str]) -> bool:
+        """Check a rule against a set built by _build_useless_lookup.
+
+        Args:
+            rule: Rule identifier to check.
+            lookup: Useless identifiers and their pylint IDs.
+
+        Returns:
+            True if the rule is useless and should be removed.
+
+        """
+        # Check direct match first
+        if rule in lookup:
+            return True
+        # Check if they're the same rule (by ID or name)
+        rule_obj = self.rules.get_by_identifier(identifier=rule)
+        return bool(rule_obj and rule_obj.pylint_id in lookup)
+
     def _is_rule_useless(self, *, rule: str, useless_rules: list[str]) -> bool:
         """Check if a rule should be considered useless.
 
@@ -306,20 +343,10 @@ class PylintCleaner:
             True if the rule is useless and should be removed.
 
         """
-        for useless_rule in useless_rules:
-            # Check direct match first
-            if rule == useless_rule:
-                return True
-            # Check if they're the same rule (by ID or name)
-            rule_obj = self.rules.get_by_identifier(identifier=rule)
-            useless_rule_obj = self.rules.get_by_identifier(identifier=useless_rule)
-            if (
-                rule_obj
-                and useless_rule_obj
-                and rule_obj.pylint_id == useless_rule_obj.pylint_id
-            ):
-                return True
-        return False
+        return self._is_rule_in_lookup(
+            rule=rule,
+            lookup=self._build_useless_lookup(useless_rules=useless_rules),
+        )
 
     def _remove_useless_rules_from_comment(  # noqa: PLR0911
         self, *, disable_comment: DisableComment, useless_rules: list[str]
@@ -342,10 +369,11 @@ class PylintCleaner:
             return disable_comment.original_line
 
         # Filter out useless rules, keeping necessary ones
+        lookup = self._build_useless_lookup(useless_rules=useless_rules)
         remaining_rules = [
             rule
             for rule in disable_comment.pylint_rules
-            if not self._is_rule_useless(rule=rule, useless_rules=useless_rules)
+            if not self._is_rule_in_lookup(rule=rule, lookup=lookup)
         ]
 
         if not remaining_rules:
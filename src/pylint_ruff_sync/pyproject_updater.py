@@ -16,6 +16,11 @@ from .toml_file import SimpleArrayWithComments, TomlFile
 
 logger = logging.getLogger(__name__)
 
+# Section holding the pylint disable/enable arrays, as a dotted path for the
+# TOML editor and as a precomputed key tuple for walking the parsed dict
+MESSAGES_CONTROL_SECTION = "tool.pylint.messages_control"
+_MESSAGES_CONTROL_KEYS = tuple(MESSAGES_CONTROL_SECTION.split("."))
+
 
 @dataclass
 class RuleFormat:
@@ -104,13 +109,19 @@ class PyprojectUpdater:
                 logger.info("  - Rules to enable: %d", len(rules_to_enable))
             return
 
-        # Step 1: Update disable array with "all" and collected disable rules
-        self._update_disable_array(rules_to_disable, unknown_disabled_rules)
-
-        # Step 2: Update enable array with URL comments
-        self._update_enable_array(enable_rules=rules_to_enable)
+        # Step 1: Update the disable array ("all" and collected disable rules)
+        # and the enable array (with URL comments) in a single edit
+        self.toml_file.update_section_arrays(
+            arrays={
+                "disable": self._build_disable_array(
+                    rules_to_disable, unknown_disabled_rules
+                ),
+                "enable": self._build_enable_array(enable_rules=rules_to_enable),
+            },
+            section_path=MESSAGES_CONTROL_SECTION,
+        )
 
-        # Step 3: Save the file
+        # Step 2: Save the file
         self.save()
         logger.info("Configuration updated successfully")
 
@@ -131,13 +142,12 @@ class PyprojectUpdater:
         self._add_user_disabled_rules()
 
         # Load existing configuration to check currently disabled and enabled rules
-        current_dict = self.toml_file.as_dict()
-        messages_control = (
-            current_dict.get("tool", {}).get("pylint", {}).get("messages_control", {})
+        current_disable = self.toml_file.get_section_array(
+            key="disable", section_path=MESSAGES_CONTROL_SECTION
+        )
+        current_enable = self.toml_file.get_section_array(
+            key="enable", section_path=MESSAGES_CONTROL_SECTION
         )
-
-        current_disable = messages_control.get("disable", [])
-        current_enable = messages_control.get("enable", [])
 
         # Convert to sets for easier checking (includes both rule IDs and names)
         current_disable_set = set(current_disable) if current_disable else set()
@@ -182,12 +192,9 @@ class PyprojectUpdater:
     def _add_user_disabled_rules(self) -> None:
         """Add user-disabled rules that aren't in the main rule set."""
         # Load existing configuration to check currently disabled rules
-        current_dict = self.toml_file.as_dict()
-        messages_control = (
-            current_dict.get("tool", {}).get("pylint", {}).get("messages_control", {})
+        current_disable = self.toml_file.get_section_array(
+            key="disable", section_path=MESSAGES_CONTROL_SECTION
         )
-
-        current_disable = messages_control.get("disable", [])
         if not current_disable:
             return
 
@@ -217,15 +224,18 @@ class PyprojectUpdater:
         self.toml_file.write()
         logger.debug("Saved configuration to %s", self.config_file)
 
-    def _update_disable_array(
+    def _build_disable_array(
         self, disable_rules: list[Rule], unknown_disabled_rules: list[str]
-    ) -> None:
-        """Update the disable array with "all", disable rules, and unknown rules.
+    ) -> SimpleArrayWithComments:
+        """Build the disable array with "all", disable rules, and unknown rules.
 
         Args:
             disable_rules: List of rules to disable.
             unknown_disabled_rules: List of unknown rule identifiers to keep disabled.
 
+        Returns:
+            The disable array with comments based on format settings.
+
         """
         # Collect all disable items and their comments
         disable_items = []
@@ -263,34 +273,28 @@ class PyprojectUpdater:
         disable_items.sort(key=str.lower)
 
         # Create SimpleArrayWithComments for proper formatting
-        disable_array = SimpleArrayWithComments(
+        return SimpleArrayWithComments(
             comments=disable_comments
             if self.rule_format.comment_type != "none"
             else None,
             items=disable_items,
         )
 
-        self.toml_file.update_section_array(
-            array_data=disable_array,
-            key="disable",
-            section_path="tool.pylint.messages_control",
-        )
-
-    def _update_enable_array(self, *, enable_rules: list[Rule]) -> None:
-        """Update the enable array with rules and comments based on format settings.
+    def _build_enable_array(
+        self, *, enable_rules: list[Rule]
+    ) -> list[str] | SimpleArrayWithComments:
+        """Build the enable array with rules and comments based on format settings.
 
         Args:
             enable_rules: List of rules to enable.
 
+        Returns:
+            The enable array, empty if there are no rules to enable.
+
         """
         if not enable_rules:
             # Ensure enable array exists but is empty
-            self.toml_file.update_section_array(
-                array_data=[],
-                key="enable",
-                section_path="tool.pylint.messages_control",
-            )
-            return
+            return []
 
         # Generate rule identifiers based on rule_format
         enable_items = []
@@ -322,18 +326,30 @@ class PyprojectUpdater:
         # Sort for consistent output (case-insensitive)
         enable_items.sort(key=str.lower)
 
-        enable_array = SimpleArrayWithComments(
+        return SimpleArrayWithComments(
             comments=enable_comments
             if self.rule_format.comment_type != "none"
             else None,
             items=enable_items,
         )
 
-        self.toml_file.update_section_array(
-            array_data=enable_array,
-            key="enable",
-            section_path="tool.pylint.messages_control",
-        )
+    @staticmethod
+    def _get_messages_control(*, current_dict: dict[str, Any]) -> dict[str, Any]:
+        """Get the messages_control table from the file dictionary.
+
+        Args:
+            current_dict: Current file content as dictionary.
+
+        Returns:
+            The messages_control table, or an empty dict if it is missing.
+
+        """
+        section: Any = current_dict
+        for key in _MESSAGES_CONTROL_KEYS:
+            if not isinstance(section, dict) or key not in section:
+                return {}
+            section = section[key]
+        return section if isinstance(section, dict) else {}
 
     def _get_current_disable_array(self, *, current_dict: dict[str, Any]) -> list[str]:
         """Get the current disable array from the file dictionary.
@@ -346,11 +362,8 @@ class PyprojectUpdater:
 
         """
         try:
-            disable_value = (
-                current_dict.get("tool", {})
-                .get("pylint", {})
-                .get("messages_control", {})
-                .get("disable", [])
+            disable_value = self._get_messages_control(current_dict=current_dict).get(
+                "disable", []
             )
             # Ensure we return a list of strings
             if isinstance(disable_value, list):
@@ -3,25 +3,93 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import subprocess
 import tempfile
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .toml_regex import TOML_REGEX
 
+try:
+    from toml_sort.tomlsort import (
+        CommentConfiguration,
+        FormattingConfiguration,
+        SortConfiguration,
+        SortOverrideConfiguration,
+        TomlSort,
+    )
+except ImportError:  # pragma: no cover - toml-sort is a runtime dependency
+    _HAS_TOML_SORT = False
+else:
+    _HAS_TOML_SORT = True
+
+try:
+    import rtoml
+except ImportError:  # pragma: no cover - rtoml is an optional speedup
+    _HAS_RTOML = False
+else:
+    _HAS_RTOML = True
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Constants
 MAX_LINE_LENGTH = 88
 
+# Resolve toml-sort once at import so each subprocess call skips the PATH
+# search; fall back to the bare name so a missing tool still raises on use
+_TOML_SORT_BIN = shutil.which("toml-sort") or "toml-sort"
+
+# Cache of file contents keyed by (path, mtime_ns, size) so unchanged files
+# are not re-read when a TomlFile is instantiated repeatedly for the same path
+_FILE_CACHE: dict[tuple[str, int, int], str] = {}
+
+# Translation table escaping newlines and other special characters in comments
+_COMMENT_ESCAPES = str.maketrans({"\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+# Cache of toml-sort results keyed by content and the repr of the settings,
+# so identical content is only sorted once per toml-sort configuration
+_SORT_CACHE: dict[tuple[str, str], str] = {}
+
+
+def _parse_toml(*, content: str) -> dict[str, Any]:
+    """Parse TOML content, using the Rust-based rtoml parser when installed.
+
+    Args:
+        content: TOML content to parse.
+
+    Returns:
+        Dictionary representation of the TOML content.
+
+    Raises:
+        tomllib.TOMLDecodeError: If the TOML content is invalid.
+
+    """
+    if not _HAS_RTOML:
+        return tomllib.loads(content)
+    try:
+        parsed: dict[str, Any] = rtoml.loads(content)
+    except rtoml.TomlParsingError as exc:
+        # Raise the stdlib error so callers only need to handle one type
+        raise tomllib.TOMLDecodeError(str(exc)) from exc
+    return parsed
+
 
 def apply_toml_sort_subprocess(*, content: str, working_directory: Path) -> str:
     """Apply toml-sort using subprocess to properly format TOML content.
 
+    The content is piped through toml-sort's stdin and read back from stdout,
+    so no temporary file is needed. toml-sort rejects stdin when the user's
+    configuration enables in_place, so a temporary file is sorted in place
+    instead in that case.
+
     Args:
         content: TOML content to sort.
         working_directory: Working directory for subprocess.
@@ -36,6 +104,47 @@ def apply_toml_sort_subprocess(*, content: str, working_directory: Path) -> str:
     if not content.strip():
         return content
 
+    settings = _load_toml_sort_settings(working_directory=working_directory)
+    if settings.get("in_place"):
+        return _apply_toml_sort_subprocess_in_place(
+            content=content, working_directory=working_directory
+        )
+
+    try:
+        # The --ignore-case flag ensures consistent sorting
+        result = subprocess.run(
+            [_TOML_SORT_BIN, "--ignore-case", "-"],
+            capture_output=True,
+            check=True,
+            cwd=working_directory,
+            input=content,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        error_msg = f"toml-sort failed: {e.stderr}"
+        logger.exception(error_msg)
+        raise
+
+    # toml-sort only prints the content when sorting changed it
+    return result.stdout or content
+
+
+def _apply_toml_sort_subprocess_in_place(
+    *, content: str, working_directory: Path
+) -> str:
+    """Apply toml-sort using subprocess on a temporary file.
+
+    Args:
+        content: TOML content to sort.
+        working_directory: Working directory for subprocess.
+
+    Returns:
+        Sorted TOML content.
+
+    Raises:
+        subprocess.CalledProcessError: If toml-sort command fails.
+
+    """
     try:
         # Create a temporary file to avoid stdin issues with in_place config
         with tempfile.NamedTemporaryFile(
@@ -48,7 +157,7 @@ def apply_toml_sort_subprocess(*, content: str, working_directory: Path) -> str:
             # Run toml-sort on the temporary file using user's configuration
             # The --in-place and --ignore-case flags ensure consistent sorting
             subprocess.run(
-                ["toml-sort", "--in-place", "--ignore-case", temp_file_path],
+                [_TOML_SORT_BIN, "--in-place", "--ignore-case", temp_file_path],
                 capture_output=True,
                 check=True,
                 cwd=working_directory,
@@ -68,6 +177,117 @@ def apply_toml_sort_subprocess(*, content: str, working_directory: Path) -> str:
         raise
 
 
+def _load_toml_sort_settings(*, working_directory: Path) -> dict[str, Any]:
+    """Load the [tool.tomlsort] settings the toml-sort CLI would pick up.
+
+    Args:
+        working_directory: Directory containing the pyproject.toml to read.
+
+    Returns:
+        The tool.tomlsort table, or an empty dict if there is none.
+
+    """
+    try:
+        document = _parse_toml(
+            content=(working_directory / "pyproject.toml").read_text(encoding="utf-8")
+        )
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+    settings = document.get("tool", {}).get("tomlsort", {})
+    return settings if isinstance(settings, dict) else {}
+
+
+def _build_toml_sort(*, content: str, settings: dict[str, Any]) -> TomlSort:
+    """Build a TomlSort configured the way the toml-sort CLI configures it.
+
+    Args:
+        content: TOML content to sort.
+        settings: The [tool.tomlsort] settings.
+
+    Returns:
+        A TomlSort instance ready to sort the content.
+
+    """
+    sort_all = bool(settings.get("all"))
+    no_comments = bool(settings.get("no_comments"))
+
+    overrides = {
+        path: SortOverrideConfiguration(**override)
+        for path, override in settings.get("overrides", {}).items()
+    }
+    first = []
+    for full_key in settings.get("sort_first", []):
+        path, _, base_key = full_key.strip().rpartition(".")
+        if path:
+            overrides.setdefault(path, SortOverrideConfiguration()).first.append(
+                base_key
+            )
+        else:
+            first.append(base_key)
+
+    return TomlSort(
+        input_toml=content,
+        comment_config=CommentConfiguration(
+            header=not (
+                settings.get("no_header")
+                or settings.get("no_header_comments")
+                or no_comments
+            ),
+            footer=not (settings.get("no_footer_comments") or no_comments),
+            block=not (settings.get("no_block_comments") or no_comments),
+            inline=not (settings.get("no_inline_comments") or no_comments),
+        ),
+        sort_config=SortConfiguration(
+            # Matches the --ignore-case flag passed to the CLI
+            ignore_case=True,
+            tables=not settings.get("no_sort_tables"),
+            table_keys=bool(settings.get("sort_table_keys") or sort_all),
+            inline_tables=bool(settings.get("sort_inline_tables") or sort_all),
+            inline_arrays=bool(settings.get("sort_inline_arrays") or sort_all),
+            first=first,
+        ),
+        format_config=FormattingConfiguration(
+            # The CLI defaults to one space, unlike FormattingConfiguration
+            spaces_before_inline_comment=settings.get(
+                "spaces_before_inline_comment", 1
+            ),
+            spaces_indent_inline_array=settings.get("spaces_indent_inline_array", 2),
+            trailing_comma_inline_array=bool(
+                settings.get("trailing_comma_inline_array")
+            ),
+        ),
+        sort_config_overrides=overrides,
+    )
+
+
+def apply_toml_sort_library(*, content: str, working_directory: Path) -> str:
+    """Apply toml-sort in-process to properly format TOML content.
+
+    This avoids starting a toml-sort process while still honouring the user's
+    [tool.tomlsort] configuration, in the same way as the CLI does. Results
+    are memoized, so sorting the same content with the same settings again
+    is a dictionary lookup.
+
+    Args:
+        content: TOML content to sort.
+        working_directory: Directory whose pyproject.toml holds the settings.
+
+    Returns:
+        Sorted TOML content.
+
+    """
+    if not content.strip():
+        return content
+
+    settings = _load_toml_sort_settings(working_directory=working_directory)
+    cache_key = (content, repr(settings))
+    sorted_content = _SORT_CACHE.get(cache_key)
+    if sorted_content is None:
+        sorted_content = _build_toml_sort(content=content, settings=settings).sorted()
+        _SORT_CACHE[cache_key] = sorted_content
+    return sorted_content
+
+
 @dataclass
 class SimpleArrayWithComments:
     """Represents a simple TOML array with optional comments for each item.
@@ -100,51 +320,64 @@ class SimpleArrayWithComments:
             self.comments.get(item, "") for item in self.items
         )
 
-        # Check if single-line format would exceed character limit
-        item_strings = [f'"{item}"' for item in self.items]
-        single_line_format = f"[{', '.join(item_strings)}]"
-        exceeds_line_limit = len(single_line_format) > MAX_LINE_LENGTH
+        # Check if single-line format would exceed character limit, counting
+        # the brackets, quotes and ", " separators instead of building it
+        single_line_length = sum(len(item) + 4 for item in self.items)
+        exceeds_line_limit = single_line_length > MAX_LINE_LENGTH
 
         # Use multiline format if we have comments OR exceed line limit
         if not has_comments and not exceeds_line_limit:
             # Single-line format for arrays without comments and within limit
-            return single_line_format
-
-        # Multi-line format for arrays with comments or long lines
-        lines = ["["]
-        for i, item in enumerate(self.items):
-            comment = self.comments.get(item, "") if self.comments else ""
-            is_last = i == len(self.items) - 1
-
-            # Escape newlines and other special characters in comments
-            if comment:
-                # Replace newlines with escaped newlines and remove other
-                # problematic chars
-                comment = (
-                    comment.replace("\n", "\\n")
-                    .replace("\r", "\\r")
-                    .replace("\t", "\\t")
+            item_strings = [f'"{item}"' for item in self.items]
+            return f"[{', '.join(item_strings)}]"
+
+        # Multi-line format for arrays with comments or long lines; the
+        # comment lookup and last-item handling are decided outside the loop
+        *leading_items, last_item = self.items
+        if has_comments:
+            comments = self.comments or {}
+            lines = [
+                self._format_line(
+                    item=item, separator=",", comment=comments.get(item, "")
+                )
+                for item in leading_items
+            ]
+            lines.append(
+                self._format_line(
+                    item=last_item, separator="", comment=comments.get(last_item, "")
                 )
+            )
+        else:
+            lines = [f'  "{item}",' for item in leading_items]
+            lines.append(f'  "{last_item}"')
+        return "[\n" + "\n".join(lines) + "\n]"
+
+    @staticmethod
+    def _format_line(*, item: str, separator: str, comment: str) -> str:
+        """Format one line of a multi-line array.
+
+        Args:
+            item: The array item.
+            separator: The separator following the item ("," or "").
+            comment: The item's comment, or an empty string for none.
 
-            if comment:
-                if is_last:
-                    lines.append(f'  "{item}" # {comment}')
-                else:
-                    lines.append(f'  "{item}", # {comment}')
-            elif is_last:
-                lines.append(f'  "{item}"')
-            else:
-                lines.append(f'  "{item}",')
-        lines.append("]")
-        return "\n".join(lines)
+        Returns:
+            The formatted line.
+
+        """
+        if not comment:
+            return f'  "{item}"{separator}'
+        # Escape newlines and other special characters in comments
+        return f'  "{item}"{separator} # {comment.translate(_COMMENT_ESCAPES)}'
 
 
 class TomlFile:
     """Represents a TOML file with in-memory editing capabilities.
 
     This class loads a TOML file once into memory and provides methods to modify
-    the in-memory representation. All changes are applied with toml-sort formatting.
-    The file is only written when explicitly requested.
+    the in-memory representation. Edits are kept unsorted and toml-sort is applied
+    once, the next time the content is read as a string or written. The file is
+    only written when explicitly requested.
 
     """
 
@@ -157,45 +390,71 @@ class TomlFile:
         """
         self.file_path = file_path
         self._raw_content = ""
+        self._disk_content: str | None = None
         self._raw_content = self._load_file()
+        self._dirty = False
+        self._parsed_cache: dict[str, Any] | None = None
 
-    @property
-    def _content(self) -> str:
-        """Get the current file content.
+    def _set_content(self, *, content: str) -> None:
+        """Replace the in-memory content after an edit.
 
-        Returns:
-            The current file content as a string.
+        The parsed dictionary is discarded and the content is marked as needing
+        toml-sort, which is deferred so a sequence of edits is only sorted once.
+
+        Args:
+            content: The new content to set.
 
         """
-        return self._raw_content
+        self._raw_content = content
+        self._dirty = True
+        self._parsed_cache = None
 
-    @_content.setter
-    def _content(self, value: str) -> None:
-        """Set the file content with automatic toml-sort application.
+    def _sorted_content(self) -> str:
+        """Get the current content, applying toml-sort if it has pending edits.
 
-        Args:
-            value: The new content to set.
+        Returns:
+            The sorted file content as a string.
 
         """
-        # Apply toml-sort automatically whenever content changes
-        self._raw_content = self._apply_toml_sort(content=value)
+        if self._dirty:
+            self._raw_content = self._apply_toml_sort(content=self._raw_content)
+            self._dirty = False
+        return self._raw_content
 
     def _load_file(self) -> str:
         """Load the TOML file content from disk.
 
+        The content is cached by path, modification time and size, so an
+        unchanged file is only read once. The loaded content is also kept as
+        the on-disk content, so write() can tell whether anything changed.
+
         Returns:
             The file content as a string.
 
         """
-        if not self.file_path.exists():
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
             return ""
-        return self.file_path.read_text(encoding="utf-8")
+
+        cache_key = (str(self.file_path), stat.st_mtime_ns, stat.st_size)
+        content = _FILE_CACHE.get(cache_key)
+        if content is None:
+            # Decode the raw bytes in one pass instead of through a text wrapper
+            content = self.file_path.read_bytes().decode("utf-8")
+            if "\r" in content:
+                # Apply the same universal newline translation as read_text
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            _FILE_CACHE[cache_key] = content
+        self._disk_content = content
+        return content
 
     def _apply_toml_sort(self, *, content: str) -> str:
-        """Apply toml-sort formatting to the content using subprocess.
+        """Apply toml-sort formatting to the content.
 
-        This method uses the toml-sort CLI tool via subprocess, which respects
-        the user's toml-sort configuration in their pyproject.toml file.
+        toml-sort is run in-process when it can be imported, falling back to the
+        CLI tool via subprocess otherwise. Both respect the user's toml-sort
+        configuration in their pyproject.toml file.
 
         Args:
             content: TOML content to sort.
@@ -204,6 +463,10 @@ class TomlFile:
             Sorted TOML content.
 
         """
+        if _HAS_TOML_SORT:
+            return apply_toml_sort_library(
+                content=content, working_directory=self.file_path.parent
+            )
         return apply_toml_sort_subprocess(
             content=content, working_directory=self.file_path.parent
         )
@@ -211,6 +474,10 @@ class TomlFile:
     def as_dict(self) -> dict[str, Any]:
         """Return the current file content as a dictionary.
 
+        The parsed result is cached until the content is next edited, so
+        repeated lookups only parse it once. Applying toml-sort only reorders
+        the content and does not invalidate the cache.
+
         Returns:
             Dictionary representation of the TOML file.
 
@@ -218,22 +485,96 @@ class TomlFile:
             tomllib.TOMLDecodeError: If the TOML content is invalid.
 
         """
-        if not self._content.strip():
+        if self._parsed_cache is not None:
+            return self._parsed_cache
+        content = self._raw_content
+        if not content.strip():
             return {}
         try:
-            return tomllib.loads(self._content)
+            self._parsed_cache = _parse_toml(content=content)
         except tomllib.TOMLDecodeError:
             logger.exception("Failed to parse TOML content")
             raise
+        return self._parsed_cache
+
+    def get_section_array(self, *, key: str, section_path: str) -> list[str] | None:
+        """Return a single array from a specific section.
+
+        Unless the content has already been parsed, only the key's value is
+        located with TomlRegex and parsed, rather than the whole file. The
+        full parse is used when the value cannot be located that way, for
+        example when the key is written as a dotted key in a parent table.
+
+        Args:
+            key: Key within the section.
+            section_path: Dot-separated path to the section.
+
+        Returns:
+            The array items as strings, or None if the key is missing or its
+            value is not an array.
+
+        """
+        value: object = None
+        if self._parsed_cache is None:
+            value = self._find_section_value(key=key, section_path=section_path)
+        if value is None:
+            value = self.as_dict()
+            for part in [*section_path.split("."), key]:
+                value = value.get(part) if isinstance(value, dict) else None
+        if not isinstance(value, list):
+            return None
+        return [str(item) for item in value]
+
+    def _find_section_value(self, *, key: str, section_path: str) -> object:
+        """Locate a key in a section with TomlRegex and parse only its value.
+
+        Args:
+            key: Key within the section.
+            section_path: Dot-separated path to the section.
+
+        Returns:
+            The parsed value, or None if it could not be located and parsed.
+
+        """
+        value_text = self._find_value_text(
+            content=self._raw_content, key=key, section_path=section_path
+        )
+        if value_text is None:
+            return None
+        try:
+            return _parse_toml(content=f"value = {value_text}")["value"]
+        except tomllib.TOMLDecodeError:
+            return None
+
+    @staticmethod
+    def _find_value_text(*, content: str, key: str, section_path: str) -> str | None:
+        """Locate the raw text of a key's value within a section.
+
+        Args:
+            content: TOML content to search.
+            key: Key within the section.
+            section_path: Dot-separated path to the section.
+
+        Returns:
+            The value text up to the next key, section or end of file, or None
+            if the key is not found in the section.
+
+        """
+        # The search is bounded to the section, so a key of the same name in a
+        # later section is never picked up
+        result = TOML_REGEX.find_key_in_section(content, key, section_path)
+        if result.match is None:
+            return None
+        return content[result.match.end(1) : result.match.end()]
 
     def as_str(self) -> str:
         """Return the current file content as a string.
 
         Returns:
-            String representation of the TOML file (already sorted).
+            String representation of the TOML file (sorted).
 
         """
-        return self._content
+        return self._sorted_content()
 
     def update_section_array(
         self,
@@ -249,62 +590,128 @@ class TomlFile:
             section_path: Dot-separated path to the section.
 
         """
-        if isinstance(array_data, SimpleArrayWithComments):
-            formatted_array = array_data.format_as_toml()
-        # Simple list - format as basic TOML array and let toml-sort handle formatting
-        elif not array_data:
-            formatted_array = "[]"
-        else:
-            formatted_items = [f'"{item}"' for item in array_data]
-            formatted_array = f"[{', '.join(formatted_items)}]"
-
-        self._update_section_key_with_regex(
-            key=key,
-            new_value=formatted_array,
+        self.update_section_arrays(
+            arrays={key: array_data},
             section_path=section_path,
         )
 
-    def _update_section_key_with_regex(
+    def update_section_arrays(
         self,
-        key: str,
-        new_value: str,
+        *,
+        arrays: Mapping[str, list[str] | SimpleArrayWithComments],
         section_path: str,
     ) -> None:
-        """Update a specific key in a section using regex replacement.
+        """Update several arrays in a specific section in a single edit.
 
-        This method uses the centralized TomlRegex class for all regex operations.
+        All changed keys are applied as one batch edit of the section, and the
+        result is set once, so the batch costs a single content update. Keys
+        that already hold the new value are left alone, and if nothing changes
+        the content is not marked as needing toml-sort.
 
         Args:
-            key: Key within the section to update.
-            new_value: New value for the key.
+            arrays: Mapping of key to either a simple list of strings or
+                SimpleArrayWithComments.
             section_path: Dot-separated path to the section.
 
         """
-        # Work with the current content and only set it once at the end
-        current_content = self._content
+        # One pass over the original content locates every key for comparing
+        # the current values
+        spans = TOML_REGEX.scan(self._raw_content).get(section_path, {})
+        edits = []
+        for key, array_data in arrays.items():
+            new_value = self._format_array(array_data=array_data)
+            span = spans.get(key)
+            if span is not None:
+                current_value = self._raw_content[span[0] : span[1]].split("=", 1)[1]
+                if current_value.strip() == new_value:
+                    continue
+            edits.append((section_path, key, new_value))
+        if not edits:
+            return
+        content = TOML_REGEX.batch_edit(self._raw_content, edits)
+        if content != self._raw_content:
+            self._set_content(content=content)
+
+    @staticmethod
+    def _format_array(*, array_data: list[str] | SimpleArrayWithComments) -> str:
+        """Format array data as a TOML array value.
 
-        try:
-            # Try to replace the key using the centralized regex
-            new_content = TOML_REGEX.replace_key_in_section(
-                content=current_content,
-                key=key,
-                new_value=new_value,
-                section_path=section_path,
-            )
-        except ValueError:
-            # Key not found, add it using the centralized regex
-            new_content = TOML_REGEX.add_key_to_section(
-                content=current_content,
-                key=key,
-                section_path=section_path,
-                value=new_value,
-            )
+        Args:
+            array_data: Either a simple list of strings or SimpleArrayWithComments.
+
+        Returns:
+            The formatted TOML array.
 
-        # Only set the content once at the end
-        self._content = new_content
+        """
+        if isinstance(array_data, SimpleArrayWithComments):
+            return array_data.format_as_toml()
+        # Simple list - format as basic TOML array and let toml-sort handle formatting
+        if not array_data:
+            return "[]"
+        formatted_items = [f'"{item}"' for item in array_data]
+        return f"[{', '.join(formatted_items)}]"
 
     def write(self) -> None:
-        """Write the current in-memory content to the file with toml-sort formatting."""
-        # Apply toml-sort before writing
-        formatted_content = self._apply_toml_sort(content=self._content)
-        self.file_path.write_text(formatted_content, encoding="utf-8")
+        """Write the current in-memory content to the file.
+
+        Pending edits are sorted with toml-sort once before writing. The content
+        is encoded once and written in binary mode, bypassing the text layer.
+        The written content is already sorted, so it is cached as the file's
+        content and a later load of the same file does not read it back.
+
+        If the content matches what is already on disk the file is left
+        untouched, so its modification time only changes on a real update.
+        """
+        content = self._sorted_content()
+        if content == self._disk_content:
+            logger.debug("No changes to write to %s", self.file_path)
+            return
+        self.file_path.write_bytes(content.encode("utf-8"))
+        self._disk_content = content
+        stat = self.file_path.stat()
+        _FILE_CACHE[str(self.file_path), stat.st_mtime_ns, stat.st_size] = content
+
+    @classmethod
+    def load_many(cls, *, file_paths: Sequence[Path]) -> list[TomlFile]:
+        """Load several TOML files concurrently.
+
+        Each file is read on a worker thread, so the reads overlap and the
+        total wait is close to the slowest read rather than the sum of them.
+
+        Args:
+            file_paths: Paths of the TOML files to load.
+
+        Returns:
+            TomlFile instances in the same order as the paths.
+
+        """
+        if len(file_paths) <= 1:
+            return [cls(file_path=file_path) for file_path in file_paths]
+
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(cls, file_path=file_path) for file_path in file_paths
+            ]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def write_many(*, files: Sequence[TomlFile]) -> None:
+        """Write several TOML files concurrently.
+
+        Each file is written on a worker thread. Any toml-sort subprocess a
+        write waits on releases the GIL, so independent files are processed
+        in parallel.
+
+        Args:
+            files: TomlFile instances to write.
+
+        """
+        if len(files) <= 1:
+            for toml_file in files:
+                toml_file.write()
+            return
+
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(toml_file.write) for toml_file in files]
+            for future in futures:
+                future.result()
@@ -6,53 +6,218 @@ file editing operations, with comprehensive documentation and examples.
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from re import Match, Pattern
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-@dataclass
+
+@dataclass(slots=True)
 class RegexMatch:
     """Result of a regex match operation.
 
     Attributes:
         match: The regex match object, or None if no match.
         matched: Whether a match was found.
-        groups: Captured groups from the match.
 
     """
 
     match: Match[str] | None
     matched: bool
-    groups: tuple[str, ...] = ()
 
-    def __post_init__(self) -> None:
-        """Initialize groups from match object."""
+    @property
+    def groups(self) -> tuple[str, ...]:
+        """Captured groups from the match, computed only when requested.
+
+        Returns:
+            The match groups, or an empty tuple if nothing matched.
+
+        """
         if self.match:
-            self.groups = self.match.groups()
+            return self.match.groups()
+        return ()
 
 
-class TomlRegex:
-    """Regular expression patterns for TOML file manipulation.
+# A key's value runs line by line until the next line that starts a key or a
+# section, or the end of the content. Each iteration consumes a whole line
+# and is only tried once at each newline, so the match stays linear in the
+# length of the value instead of probing a lookahead at every character.
+_VALUE_PATTERN = r"(?:[^\n]*+\n(?!\s*+\w++\s*+=|\s*+\[))*+[^\n]*+\n?"
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_section_pattern(*, section_path: str) -> Pattern[str]:
+    """Compile the section header pattern once per section path.
+
+    Args:
+        section_path: Dot-separated path to the section.
+
+    Returns:
+        Compiled regex pattern that matches the section header.
 
-    This class provides pre-compiled regex patterns for common TOML editing
-    operations like finding sections, keys, and values. All patterns are
-    thoroughly documented with examples.
     """
+    escaped_path = re.escape(section_path)
+    pattern = rf"^\[{escaped_path}\]"
+    return re.compile(pattern, re.MULTILINE)
 
-    def __init__(self) -> None:
-        """Initialize the TomlRegex with compiled patterns."""
-        # Compile all patterns for better performance
-        self._section_header_pattern = re.compile(r"^\[([^\]]+)\]", re.MULTILINE)
 
-        self._key_value_pattern = re.compile(
-            r"^(\s*)([a-zA-Z_][a-zA-Z0-9_-]*)\s*=\s*(.+?)$", re.MULTILINE
-        )
+@functools.lru_cache(maxsize=128)
+def _compile_key_exists_pattern(*, key: str) -> Pattern[str]:
+    """Compile the key existence pattern once per key.
 
-        self._multiline_array_pattern = re.compile(
-            r"^(\s*)([a-zA-Z_][a-zA-Z0-9_-]*)\s*=\s*\[\s*\n(.*?)\n\s*\]",
-            re.MULTILINE | re.DOTALL,
-        )
+    Args:
+        key: The key name to check for.
+
+    Returns:
+        Compiled regex pattern for existence checking.
+
+    """
+    escaped_key = re.escape(key)
+    pattern = rf"^\s*{escaped_key}\s*="
+    return re.compile(pattern, re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_section_content_pattern(*, section_path: str) -> Pattern[str]:
+    """Compile the section content pattern once per section path.
+
+    Args:
+        section_path: Dot-separated path to the section.
+
+    Returns:
+        Compiled regex pattern that captures section content.
+
+    """
+    # Reuse the cached header pattern so the path is escaped only once
+    section_pattern = _compile_section_pattern(section_path=section_path)
+
+    # Pattern explanation:
+    # - ({section_pattern.pattern}.*?) captures:
+    #   * The section header: [tool.pylint]
+    #   * All content in the section
+    # - (?=^\[|\Z) positive lookahead for boundaries:
+    #   * ^\[ : next section header
+    #   * \Z : end of string
+    pattern = rf"({section_pattern.pattern}.*?)(?=^\[|\Z)"
+    return re.compile(pattern, re.MULTILINE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_key_in_section_pattern(*, key: str, section_path: str) -> Pattern[str]:
+    """Compile the key-in-section pattern once per key and section path.
+
+    Updates only touch a handful of keys (disable, enable) in a handful of
+    sections, so the cache stays small and every repeat edit is a hit.
+
+    Args:
+        key: The key name to find.
+        section_path: Dot-separated path to the section.
+
+    Returns:
+        Compiled regex pattern with capture groups.
+
+    """
+    section_pattern = _compile_section_pattern(section_path=section_path)
+    escaped_key = re.escape(key)
+
+    # Pattern explanation:
+    # - ({section_pattern.pattern}.*?^\s*+{escaped_key}\s*+=\s*) captures:
+    #   * The section header: [tool.pylint.messages_control]
+    #   * Any content between section and key (other keys, comments, whitespace)
+    #   * The key name and equals sign: "disable = "
+    # - _VALUE_PATTERN matches the value up to the next boundary:
+    #   * a line starting with a key-value pair: \s*+\w++\s*+=
+    #   * a line starting with a section header: \s*+\[
+    #   * the end of the string
+    # Whitespace and word runs use possessive quantifiers (*+, ++): the
+    # character that follows them can never be part of the run, so giving
+    # characters back is pointless and only adds backtracking on long files.
+    pattern = (
+        rf"({section_pattern.pattern}.*?^\s*+{escaped_key}\s*+=\s*)"
+        rf"{_VALUE_PATTERN}"
+    )
+    return re.compile(pattern, re.MULTILINE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_key_value_pattern(*, key: str) -> Pattern[str]:
+    """Compile the key-value pattern used inside a section span once per key.
+
+    Unlike the key-in-section pattern this carries no section prefix; callers
+    bound the search to the section with ``pos``/``endpos`` instead, so the
+    regex never has to walk from the header to the key.
+
+    Args:
+        key: The key name to find.
+
+    Returns:
+        Compiled regex pattern whose first group is ``key = ``.
+
+    """
+    escaped_key = re.escape(key)
+    pattern = rf"(^\s*+{escaped_key}\s*+=\s*){_VALUE_PATTERN}"
+    return re.compile(pattern, re.MULTILINE)
+
+
+def _find_section_span(*, content: str, section_path: str) -> tuple[int, int] | None:
+    """Locate a section with plain string searches.
+
+    The span runs from the start of the section header to the start of the
+    next section header, or the end of the content.
+
+    Args:
+        content: TOML content to search.
+        section_path: Dot-separated path to the section.
+
+    Returns:
+        The ``(start, end)`` offsets of the section, or None if it is absent.
+
+    """
+    header = f"[{section_path}]"
+    start = content.find(header)
+    # Only a header at the start of a line counts, which also rules out
+    # ``[[section]]`` arrays of tables and mentions inside values
+    while start > 0 and content[start - 1] != "\n":
+        start = content.find(header, start + 1)
+    if start == -1:
+        return None
+    end = content.find("\n[", start + len(header))
+    return start, len(content) if end == -1 else end + 1
+
+
+def _key_starts_line(*, content: str, key: str) -> bool:
+    """Check whether any line assigns the key, using string methods only.
+
+    This matches the same lines as the key existence pattern: optional
+    leading whitespace, the key, optional whitespace and then ``=``.
+
+    Args:
+        content: TOML content to search, usually a single section.
+        key: The key name to check for.
+
+    Returns:
+        True if a line assigns the key, False otherwise.
+
+    """
+    for line in content.splitlines():
+        stripped = line.lstrip()
+        if stripped.startswith(key) and stripped[len(key) :].lstrip().startswith("="):
+            return True
+    return False
+
+
+class TomlRegex:
+    """Regular expression patterns for TOML file manipulation.
+
+    This class is a stateless namespace over the module-level pattern
+    builders, which compile each pattern once and cache it, for common TOML
+    editing operations like finding sections, keys, and values. All patterns
+    are thoroughly documented with examples.
+    """
 
     def build_section_pattern(self, *, section_path: str) -> Pattern[str]:
         """Build a regex pattern to match a specific TOML section header.
@@ -78,9 +243,7 @@ class TomlRegex:
             False
 
         """
-        escaped_path = re.escape(section_path)
-        pattern = rf"^\[{escaped_path}\]"
-        return re.compile(pattern, re.MULTILINE)
+        return _compile_section_pattern(section_path=section_path)
 
     def build_key_in_section_pattern(
         self, *, key: str, section_path: str
@@ -118,24 +281,7 @@ class TomlRegex:
             True
 
         """
-        section_pattern = self.build_section_pattern(section_path=section_path)
-        escaped_key = re.escape(key)
-
-        # Pattern explanation:
-        # - ({section_pattern.pattern}.*?^\s*{escaped_key}\s*=\s*) captures:
-        #   * The section header: [tool.pylint.messages_control]
-        #   * Any content between section and key (other keys, comments, whitespace)
-        #   * The key name and equals sign: "disable = "
-        # - .*? matches the value (non-greedy to stop at next boundary)
-        # - (?=^\s*\w+\s*=|^\s*\[|\Z) positive lookahead for boundaries:
-        #   * ^\s*\w+\s*= : next key-value pair
-        #   * ^\s*\[ : next section header
-        #   * \Z : end of string
-        pattern = (
-            rf"({section_pattern.pattern}.*?^\s*{escaped_key}\s*=\s*)"
-            rf".*?(?=^\s*\w+\s*=|^\s*\[|\Z)"
-        )
-        return re.compile(pattern, re.MULTILINE | re.DOTALL)
+        return _compile_key_in_section_pattern(key=key, section_path=section_path)
 
     def build_key_exists_in_section_pattern(self, *, key: str) -> Pattern[str]:
         """Build a regex pattern to check if a key exists.
@@ -158,9 +304,7 @@ class TomlRegex:
             True
 
         """
-        escaped_key = re.escape(key)
-        pattern = rf"^\s*{escaped_key}\s*="
-        return re.compile(pattern, re.MULTILINE)
+        return _compile_key_exists_pattern(key=key)
 
     def build_section_content_pattern(self, *, section_path: str) -> Pattern[str]:
         """Build a regex pattern to capture entire section content.
@@ -196,17 +340,62 @@ class TomlRegex:
             True
 
         """
-        section_pattern = self.build_section_pattern(section_path=section_path)
-
-        # Pattern explanation:
-        # - ({section_pattern.pattern}.*?) captures:
-        #   * The section header: [tool.pylint]
-        #   * All content in the section
-        # - (?=^\[|\Z) positive lookahead for boundaries:
-        #   * ^\[ : next section header
-        #   * \Z : end of string
-        pattern = rf"({section_pattern.pattern}.*?)(?=^\[|\Z)"
-        return re.compile(pattern, re.MULTILINE | re.DOTALL)
+        return _compile_section_content_pattern(section_path=section_path)
+
+    def scan(self, content: str) -> dict[str, dict[str, tuple[int, int]]]:
+        """Map every section's keys to their offsets in a single line pass.
+
+        A key's span runs from the start of its line to the end of the last
+        non-blank line of its value, using the same boundaries as the key
+        patterns: the next key, the next section header or the end of the
+        content. Keys before the first header are listed under ``""``.
+        Array-of-tables entries (``[[...]]``) are not indexed.
+
+        Args:
+            content: TOML content to scan.
+
+        Returns:
+            Mapping of section path to a mapping of key to ``(start, end)``.
+
+        Examples:
+            >>> regex = TomlRegex()
+            >>> text = '''[tool.pylint]
+            ... disable = ["rule1"]
+            ... enable = ["rule2"]'''
+            >>> regex.scan(text)["tool.pylint"]
+            {'disable': (14, 34), 'enable': (34, 52)}
+
+        """
+        sections: dict[str, dict[str, tuple[int, int]]] = {"": {}}
+        keys = sections[""]
+        open_key: str | None = None
+        key_start = value_end = offset = 0
+
+        for line in content.splitlines(keepends=True):
+            stripped = line.strip()
+            is_header = line.startswith("[")
+            name = stripped.split("=", 1)[0].rstrip() if "=" in stripped else ""
+            is_key = not is_header and name.replace("-", "_").isidentifier()
+
+            if (is_header or is_key) and open_key is not None:
+                keys.setdefault(open_key, (key_start, value_end))
+                open_key = None
+            if is_header:
+                keys = (
+                    {}
+                    if line.startswith("[[")
+                    else sections.setdefault(stripped[1 : stripped.find("]")], {})
+                )
+            elif is_key:
+                open_key, key_start = name, offset
+
+            offset += len(line)
+            if stripped:
+                value_end = offset
+
+        if open_key is not None:
+            keys.setdefault(open_key, (key_start, value_end))
+        return sections
 
     def find_section_header(self, *, content: str, section_path: str) -> RegexMatch:
         """Find a section header in TOML content.
@@ -219,7 +408,7 @@ class TomlRegex:
             RegexMatch with the result.
 
         """
-        pattern = self.build_section_pattern(section_path=section_path)
+        pattern = _compile_section_pattern(section_path=section_path)
         match = pattern.search(content)
         return RegexMatch(match=match, matched=bool(match))
 
@@ -237,8 +426,11 @@ class TomlRegex:
             RegexMatch with the result and capture groups.
 
         """
-        pattern = self.build_key_in_section_pattern(key=key, section_path=section_path)
-        match = pattern.search(content)
+        span = _find_section_span(content=content, section_path=section_path)
+        if span is None:
+            return RegexMatch(match=None, matched=False)
+        pattern = _compile_key_value_pattern(key=key)
+        match = pattern.search(content, *span)
         return RegexMatch(match=match, matched=bool(match))
 
     def key_exists_in_section(
@@ -258,17 +450,16 @@ class TomlRegex:
             True if the key exists in the section, False otherwise.
 
         """
-        # First find the section content
-        section_pattern = self.build_section_content_pattern(section_path=section_path)
-        section_match = section_pattern.search(content)
-
-        if not section_match:
+        # A key that appears nowhere in the content cannot be in the section
+        if key not in content:
             return False
 
-        # Then check if key exists within that section
-        section_content = section_match.group(1)
-        key_pattern = self.build_key_exists_in_section_pattern(key=key)
-        return bool(key_pattern.search(section_content))
+        # Find the section, then check the key within its span only
+        span = _find_section_span(content=content, section_path=section_path)
+        if span is None:
+            return False
+        start, end = span
+        return _key_starts_line(content=content[start:end], key=key)
 
     def replace_key_in_section(
         self, content: str, key: str, new_value: str, section_path: str
@@ -288,18 +479,18 @@ class TomlRegex:
             ValueError: If the key is not found in the section.
 
         """
-        pattern = self.build_key_in_section_pattern(key=key, section_path=section_path)
-
-        # Check if the pattern matches first
-        if not pattern.search(content):
+        result = self.find_key_in_section(content, key, section_path)
+        if result.match is None:
             msg = f"Key '{key}' not found in section '{section_path}'"
             raise ValueError(msg)
 
-        # The replacement preserves everything up to and including "key = "
-        # and replaces everything after with the new value plus a newline
-        replacement = rf"\g<1>{new_value}\n"
-
-        return pattern.sub(replacement, content)
+        # Keep everything up to and including "key = " and replace the old
+        # value with the new value plus a newline
+        return (
+            content[: result.match.end(1)]
+            + f"{new_value}\n"
+            + content[result.match.end() :]
+        )
 
     def add_key_to_section(
         self, content: str, key: str, section_path: str, value: str
@@ -319,26 +510,83 @@ class TomlRegex:
             Modified TOML content with the key added.
 
         """
-        # Check if key already exists and replace if so
-        if self.key_exists_in_section(
-            content=content, key=key, section_path=section_path
-        ):
-            return self.replace_key_in_section(
-                content=content, key=key, new_value=value, section_path=section_path
-            )
-
-        # Find the section
-        section_pattern = self.build_section_content_pattern(section_path=section_path)
-        section_match = section_pattern.search(content)
-
-        if section_match:
-            # Section exists, add key to it
-            section_content = section_match.group(1)
-            new_section_content = f"{section_content.rstrip()}\n{key} = {value}\n"
-            return content.replace(section_content, new_section_content, 1)
-        # Section doesn't exist, create it
-        new_section = f"\n[{section_path}]\n{key} = {value}\n"
-        return content + new_section
+        # Find the section once and do the lookup, replacement and insertion
+        # all within that span
+        span = _find_section_span(content=content, section_path=section_path)
+        if span is None:
+            # Section doesn't exist, create it
+            return f"{content}\n[{section_path}]\n{key} = {value}\n"
+
+        start, end = span
+        key_match = _compile_key_value_pattern(key=key).search(content, start, end)
+        if key_match:
+            # Key exists, keep "key = " and replace the old value
+            return f"{content[: key_match.end(1)]}{value}\n{content[key_match.end() :]}"
+
+        # Section exists without the key, append it to the section
+        section_content = content[start:end].rstrip()
+        return f"{content[:start]}{section_content}\n{key} = {value}\n{content[end:]}"
+
+    def batch_edit(self, content: str, edits: Iterable[tuple[str, str, str]]) -> str:
+        """Apply several key edits, touching each section only once.
+
+        The result is the same as calling add_key_to_section for each edit in
+        order, but each section is located once, its edits are applied to
+        that section alone and it is spliced back in a single step, rather
+        than searching the whole content again for every edit.
+
+        Args:
+            content: TOML content to modify.
+            edits: ``(section_path, key, value)`` tuples to apply in order.
+
+        Returns:
+            Modified TOML content with all edits applied.
+
+        Examples:
+            >>> regex = TomlRegex()
+            >>> text = '''[tool.pylint]
+            ... disable = ["rule1"]
+            ... '''
+            >>> print(
+            ...     regex.batch_edit(
+            ...         text,
+            ...         [
+            ...             ("tool.pylint", "disable", '["rule2"]'),
+            ...             ("tool.pylint", "enable", '["rule3"]'),
+            ...         ],
+            ...     ),
+            ...     end="",
+            ... )
+            [tool.pylint]
+            disable = ["rule2"]
+            enable = ["rule3"]
+
+        """
+        # A later edit of the same key replaces the earlier value in place,
+        # so keep the first position and the last value
+        sections: dict[str, dict[str, str]] = {}
+        for section_path, key, value in edits:
+            sections.setdefault(section_path, {})[key] = value
+
+        for section_path, keys in sections.items():
+            span = _find_section_span(content=content, section_path=section_path)
+            if span is None:
+                # Section doesn't exist, create it with all of its keys
+                lines = "".join(f"{key} = {value}\n" for key, value in keys.items())
+                content = f"{content}\n[{section_path}]\n{lines}"
+                continue
+
+            start, end = span
+            section_content = content[start:end]
+            for key, value in keys.items():
+                section_content = self.add_key_to_section(
+                    content=section_content,
+                    key=key,
+                    section_path=section_path,
+                    value=value,
+                )
+            content = content[:start] + section_content + content[end:]
+        return content
 
 
 # Pre-compiled patterns for common operations
@@ -2,23 +2,140 @@
 
 from __future__ import annotations
 
-import re
+import functools
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, cast
 
 import pytest
 
 from tests.constants import TOML_SORT_MIN_ARGS
 
+# Every mocked executable lookup resolves to the same path
+_PYLINT_PATH = "/usr/bin/pylint"
+
+try:
+    from toml_sort.tomlsort import (
+        FormattingConfiguration,
+        SortConfiguration,
+        TomlSort,
+    )
+    from tomlkit.exceptions import TOMLKitError
+except ImportError:  # pragma: no cover - toml-sort is a runtime dependency
+    _HAS_TOML_SORT = False
+else:
+    _HAS_TOML_SORT = True
+    # The toml-sort mock configuration never changes, so build it once
+    _MOCK_SORT_CONFIG = SortConfiguration(
+        inline_arrays=True,
+        inline_tables=True,
+        table_keys=True,
+    )
+    _MOCK_FORMATTING_CONFIG = FormattingConfiguration(
+        # Don't add trailing commas
+        trailing_comma_inline_array=False,
+    )
+
+
+def _normalize_comment_spacing(*, text: str) -> str:
+    """Collapse the whitespace before a comment that follows ',' or '"'.
+
+    Change ",  # comment" to ", # comment" and '"item"  # comment' to
+    '"item" # comment', walking the comment markers with str.find instead of
+    running a regex over the whole text.
+
+    Args:
+        text: Sorted TOML content.
+
+    Returns:
+        The content with a single space before those comments.
+
+    """
+    index = text.find("#")
+    if index == -1:
+        # No comments at all, which is the common case for fixtures
+        return text
+
+    parts: list[str] = []
+    start = 0
+    while index != -1:
+        space = index
+        while space > start and text[space - 1].isspace():
+            space -= 1
+        if index - space > 1 and space > start and text[space - 1] in ',"':
+            line_end = text.find("\n", index)
+            if line_end == -1:
+                line_end = len(text)
+            parts.extend((text[start:space], " ", text[index:line_end]))
+            start = line_end
+            index = text.find("#", line_end)
+        else:
+            index = text.find("#", index + 1)
+    parts.append(text[start:])
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _sort_toml_content(*, content: str) -> str:
+    """Sort TOML content the way the toml-sort mock expects.
+
+    Sorting is deterministic and the fixtures feed the same content through
+    the mock many times in a session, so results are cached per content.
+
+    Args:
+        content: TOML content to sort.
+
+    Returns:
+        The sorted content, or the content unchanged if sorting fails.
+
+    """
+    try:
+        # Apply toml-sort with the desired configuration
+        sorter = TomlSort(
+            format_config=_MOCK_FORMATTING_CONFIG,
+            input_toml=content,
+            sort_config=_MOCK_SORT_CONFIG,
+        )
+        result = sorter.sorted()
+    except (TOMLKitError, TypeError, ValueError):
+        # If the content cannot be parsed or sorted, leave it as-is
+        return content
+
+    # Post-process to normalize spacing to match expected fixture format
+    # Fix extra spaces before comments after commas and, for last items,
+    # after the closing quote in a single pass
+    return _normalize_comment_spacing(text=result)
+
 
 class TomlSortMockProtocol(Protocol):
     """Protocol for toml sort mock function."""
 
-    def __call__(self, *, file_path: str) -> None:
-        """Apply toml sort mock to file path.
+    def __call__(self, *, content: str) -> str:
+        """Apply toml sort mock to TOML content.
 
         Args:
-            file_path: Path to the file to sort.
+            content: TOML content to sort.
+
+        Returns:
+            The sorted TOML content.
+
+        """
+        ...
+
+
+class MockSubprocessHandler(Protocol):
+    """Protocol for a mocked subprocess command handler."""
+
+    def __call__(
+        self, command_args: list[str], kwargs: dict[str, object], /
+    ) -> MockSubprocessResult:
+        """Return the mocked result for a command.
+
+        Args:
+            command_args: The command and its arguments.
+            kwargs: Keyword arguments passed to subprocess.run.
+
+        Returns:
+            The mocked subprocess result.
 
         """
         ...
@@ -40,7 +157,7 @@ class MockSubprocessResult:
         self.stderr = ""
 
 
-@pytest.fixture(name="mock_github_response")
+@pytest.fixture(name="mock_github_response", scope="session")
 def _mock_github_response() -> str:
     """Mock GitHub CLI response for tests.
 
@@ -60,7 +177,7 @@ def _mock_github_response() -> str:
     )
 
 
-@pytest.fixture(name="mock_pylint_output")
+@pytest.fixture(name="mock_pylint_output", scope="session")
 def _mock_pylint_output() -> str:
     """Mock pylint command output for tests.
 
@@ -78,80 +195,50 @@ def _mock_pylint_output() -> str:
 """
 
 
-@pytest.fixture(name="toml_sort_mock")
+@pytest.fixture(name="toml_sort_mock", scope="session")
 def _toml_sort_mock() -> TomlSortMockProtocol:
-    """Apply toml-sort with desired configuration to a file.
+    """Apply toml-sort with desired configuration to TOML content.
 
     Returns:
-        Function that applies toml-sort mock to a file path.
+        Function that applies toml-sort mock to TOML content.
 
     """
 
-    def _apply_toml_sort_mock(*, file_path: str) -> None:
-        """Apply toml-sort with desired configuration to a file.
+    def _apply_toml_sort_mock(*, content: str) -> str:
+        """Apply toml-sort with desired configuration to TOML content.
 
         Args:
-            file_path: Path to the TOML file to sort.
+            content: TOML content to sort.
+
+        Returns:
+            The sorted content, or the content unchanged if sorting fails.
 
         """
-        try:
-            # Read the file content
-            content = Path(file_path).read_text(encoding="utf-8")
-
-            # Apply toml-sort with the desired configuration
-            try:
-                # Import here to avoid import errors if toml-sort not available
-                from toml_sort.tomlsort import (  # noqa: PLC0415
-                    FormattingConfiguration,
-                    SortConfiguration,
-                    TomlSort,
-                )
-
-                # Configure toml-sort with desired settings
-                sort_config = SortConfiguration(
-                    inline_arrays=True,
-                    inline_tables=True,
-                    table_keys=True,
-                )
-                formatting_config = FormattingConfiguration(
-                    # Don't add trailing commas
-                    trailing_comma_inline_array=False,
-                )
-
-                # Apply sorting
-                sorter = TomlSort(
-                    format_config=formatting_config,
-                    input_toml=content,
-                    sort_config=sort_config,
-                )
-
-                result = sorter.sorted()
-
-                # Post-process to normalize spacing to match expected
-                # fixture format
-                # Fix extra spaces after commas in arrays with comments
-                # Change ",  # comment" to ", # comment"
-                result = re.sub(r",\s{2,}(#.*)", r", \1", result)
-
-                # Remove trailing spaces before comments in arrays
-                # (for last items)
-                # Change '"item"  # comment' to '"item" # comment'
-                result = re.sub(r'"\s{2,}(#.*)', r'" \1', result)
-
-                # Write the sorted content back to the file
-                Path(file_path).write_text(result, encoding="utf-8")
-
-            except ImportError:
-                # If toml-sort is not available, leave content as-is
-                pass
-
-        except Exception:  # noqa: S110, BLE001
-            # If anything fails, leave content as-is
-            pass
+        if not _HAS_TOML_SORT:
+            # If toml-sort is not available, leave content as-is
+            return content
+        return _sort_toml_content(content=content)
 
     return _apply_toml_sort_mock
 
 
+@pytest.fixture(name="shared_cache_path", scope="session")
+def _shared_cache_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Rules cache file shared by every test in the session.
+
+    The mocked data is the same for every test, so once the first run has
+    written the cache, later runs load it instead of rebuilding it.
+
+    Args:
+        tmp_path_factory: Pytest factory for session-scoped temporary paths.
+
+    Returns:
+        Path to the shared cache file.
+
+    """
+    return tmp_path_factory.mktemp("cache") / "test_cache.json"
+
+
 @pytest.fixture(name="mocked_subprocess")
 def _mocked_subprocess(
     *,
@@ -172,38 +259,47 @@ def _mocked_subprocess(
     mock_pylint_result = MockSubprocessResult(stdout=mock_pylint_output)
     mock_gh_result = MockSubprocessResult(stdout=mock_github_response)
 
-    def mock_subprocess_run(*args: object, **_kwargs: object) -> MockSubprocessResult:
-        # Check if this is a gh CLI command
-        if (
-            args
-            and len(args) > 0
-            and isinstance(args[0], list)
-            and len(args[0]) > 0
-            and args[0][0] == "gh"
-        ):
-            # Return mock GitHub CLI response
-            return mock_gh_result
-
-        # Check if this is a toml-sort command
-        if (
-            args
-            and len(args) > 0
-            and isinstance(args[0], list)
-            and len(args[0]) > 0
-            and args[0][0] == "toml-sort"
-        ):
-            # Handle toml-sort subprocess call
-            command_args = args[0]
-            if "--in-place" in command_args and len(command_args) >= TOML_SORT_MIN_ARGS:
-                file_path = command_args[-1]  # Last argument is the file path
-                toml_sort_mock(file_path=file_path)
-                return MockSubprocessResult(stdout="")
-
-        # For other subprocess calls (like pylint), return the default mock
+    def handle_gh(
+        _command_args: list[str], _kwargs: dict[str, object]
+    ) -> MockSubprocessResult:
+        return mock_gh_result
+
+    def handle_toml_sort(
+        command_args: list[str], kwargs: dict[str, object]
+    ) -> MockSubprocessResult:
+        if command_args[-1] == "-":
+            # Content is piped through stdin and read back from stdout
+            content = str(kwargs["input"])
+            return MockSubprocessResult(stdout=toml_sort_mock(content=content))
+        if "--in-place" in command_args and len(command_args) >= TOML_SORT_MIN_ARGS:
+            # Last argument is the file path; sort it in place through one
+            # file handle rather than reopening it to write
+            with Path(command_args[-1]).open("r+", encoding="utf-8") as file:
+                content = file.read()
+                file.seek(0)
+                file.write(toml_sort_mock(content=content))
+                file.truncate()
+            return MockSubprocessResult(stdout="")
         return mock_pylint_result
 
-    def mock_shutil_which(*, _cmd: str) -> str:
-        return "/usr/bin/pylint"
+    # Commands are dispatched on the executable name; everything else
+    # (like pylint) gets the default mock
+    dispatch: dict[str, MockSubprocessHandler] = {
+        "gh": handle_gh,
+        "toml-sort": handle_toml_sort,
+    }
+
+    def mock_subprocess_run(*args: object, **kwargs: object) -> MockSubprocessResult:
+        # A missing or empty command, or one without a handler, falls
+        # through to the default mock
+        try:
+            command_args = cast("list[str]", args[0])
+            handler = dispatch[Path(command_args[0]).name]
+        except (IndexError, KeyError, TypeError):
+            return mock_pylint_result
+        return handler(command_args, kwargs)
 
     monkeypatch.setattr("subprocess.run", mock_subprocess_run)
-    monkeypatch.setattr("shutil.which", mock_shutil_which)
+    monkeypatch.setattr("shutil.which", lambda _cmd: _PYLINT_PATH)
+    # Route toml-sort through the mocked subprocess instead of the library
+    monkeypatch.setattr("pylint_ruff_sync.toml_file._HAS_TOML_SORT", False)
@@ -2,14 +2,70 @@
 
 from __future__ import annotations
 
+import functools
 import re
-import shutil
+import tomllib
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
 
 from pylint_ruff_sync.main import main
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+# The leading quoted string of an array item line
+_ARRAY_ITEM_RE = re.compile(r'^\s*("[^"]*")', re.MULTILINE)
+# An array item line (starting with a quote) that carries a comment
+_COMMENTED_ITEM_RE = re.compile(r'^[^\S\n]*"[^\n]*#[^\n]*$', re.MULTILINE)
+# The pylint sections, up to the next section that is not a pylint one
+_PYLINT_SECTIONS_RE = re.compile(
+    r"^\[tool\.pylint.*?(?=^\[(?![^\n]*pylint)|\Z)", re.MULTILINE | re.DOTALL
+)
+# A line carrying a comment, other than a section header
+_COMMENT_LINE_RE = re.compile(r"^(?!\[)[^\n]*#[^\n]*$", re.MULTILINE)
+# A doc URL on an array item line following an enable (or disable) line,
+# before the next section header
+_ENABLE_ITEM_URL_RE = re.compile(
+    r"^(?=[^\n]*enable)[^\n]*=[^\n]*\n"
+    r"(?:(?![^\S\n]*\[)[^\n]*\n)*?"
+    r'[^\S\n]*"[^\n]*https://pylint\.readthedocs\.io[^\n]*',
+    re.MULTILINE,
+)
+
+# A minimal pyproject.toml without any pylint configuration
+_SIMPLE_PYPROJECT = b"""[build-system]
+build-backend = "setuptools.build_meta"
+requires = ["setuptools>=45", "wheel"]
+
+[project]
+name = "test-project"
+version = "0.1.0"
+"""
+# A pylint section disabling a single rule, to append to the above
+_DISABLE_W0613 = b"""
+[tool.pylint.messages_control]
+disable = ["W0613"]
+"""
+
+
+def _disable_list(*, content: str) -> list[str]:
+    """Parse the content and return the pylint disable list.
+
+    Args:
+        content: The file content to parse.
+
+    Returns:
+        The items of tool.pylint.messages_control.disable.
+
+    """
+    data = tomllib.loads(content)
+    disable: list[str] = data["tool"]["pylint"]["messages_control"]["disable"]
+    return disable
+
 
 def _verify_rule_format(*, content: str, rule_format: str) -> None:
     """Verify rule format expectations in the content.
@@ -19,36 +75,30 @@ def _verify_rule_format(*, content: str, rule_format: str) -> None:
         rule_format: The expected rule format (code or name).
 
     """
-    lines = content.split("\n")
-    array_lines = [
-        line
-        for line in lines
-        if line.strip().startswith('"')
-        and ("enable" in content or "disable" in content)
-    ]
+    # Array items are the lines starting with a quoted string; the content
+    # check is loop invariant, so it is done once up front
+    items = (
+        [match.group(1) for match in _ARRAY_ITEM_RE.finditer(content)]
+        if "enable" in content or "disable" in content
+        else []
+    )
 
     if rule_format == "code":
         # Should contain rule codes like C0103, C0111, etc.
         assert "C0103" in content
         assert "C0111" in content
         # Should not contain rule names in the arrays (except for comments)
-        for line in array_lines:
-            if '"invalid-name"' in line and line.strip().startswith('"invalid-name"'):
-                pytest.fail(
-                    f"Found rule name 'invalid-name' as array item with "
-                    f"rule_format=code: {line}"
-                )
+        if '"invalid-name"' in items:
+            pytest.fail(
+                "Found rule name 'invalid-name' as array item with rule_format=code"
+            )
     else:  # rule_format == "name"
         # Should contain rule names like invalid-name, missing-docstring, etc.
         assert "invalid-name" in content
         assert "missing-docstring" in content
         # Should not contain rule codes in the arrays (except for comments)
-        for line in array_lines:
-            if '"C0103"' in line and line.strip().startswith('"C0103"'):
-                pytest.fail(
-                    f"Found rule code 'C0103' as array item with "
-                    f"rule_format=name: {line}"
-                )
+        if '"C0103"' in items:
+            pytest.fail("Found rule code 'C0103' as array item with rule_format=name")
 
 
 def _verify_rule_comment(*, content: str, rule_comment: str, rule_format: str) -> None:
@@ -62,11 +112,10 @@ def _verify_rule_comment(*, content: str, rule_comment: str, rule_format: str) -
     """
     if rule_comment == "none":
         # Should not have any comments after rule identifiers
-        lines = content.split("\n")
-        for line in lines:
-            if line.strip().startswith('"') and "#" in line and '"all"' not in line:
-                # Allow "all" to have comments in some cases
-                pytest.fail(f"Found comment with rule_comment=none: {line}")
+        for match in _COMMENTED_ITEM_RE.finditer(content):
+            # Allow "all" to have comments in some cases
+            if '"all"' not in match.group():
+                pytest.fail(f"Found comment with rule_comment=none: {match.group()}")
     elif rule_comment == "doc_url":
         # Should contain doc URLs
         assert "https://pylint.readthedocs.io" in content
@@ -85,35 +134,55 @@ def _verify_rule_comment(*, content: str, rule_comment: str, rule_format: str) -
         assert "doesn't conform" in content or "Missing" in content
 
 
-def copy_fixture_to_temp(*, fixture_name: str, temp_dir: Path) -> Path:
-    """Copy a fixture file to temporary directory.
+def _argv(*extra: str, config_file: Path, cache_path: Path) -> list[str]:
+    """Build the command line for running the tool on a config file.
+
+    Args:
+        *extra: Additional command line arguments.
+        config_file: The config file to update.
+        cache_path: The rules cache file to use.
+
+    Returns:
+        The argument list to pass to main.
+
+    """
+    return [
+        "--config-file",
+        str(config_file),
+        "--cache-path",
+        str(cache_path),
+        *extra,
+    ]
+
+
+@functools.cache
+def _fixture_bytes(*, fixture_name: str) -> bytes:
+    """Read a fixture file once per test session.
 
     Args:
         fixture_name: Name of the fixture file
-        temp_dir: Temporary directory to copy to
 
     Returns:
-        Path to the copied file
+        Raw content of the fixture file
 
     """
-    fixture_path = Path(__file__).parent.parent / "fixtures" / fixture_name
-    temp_file = temp_dir / "pyproject.toml"
-    shutil.copy2(fixture_path, temp_file)
-    return temp_file
+    return (_FIXTURES_DIR / fixture_name).read_bytes()
 
 
-def read_expected_result(*, fixture_name: str) -> str:
-    """Read the expected result from an 'after' fixture.
+def copy_fixture_to_temp(*, fixture_name: str, temp_dir: Path) -> Path:
+    """Copy a fixture file to temporary directory.
 
     Args:
-        fixture_name: Name of the 'after' fixture file
+        fixture_name: Name of the fixture file
+        temp_dir: Temporary directory to copy to
 
     Returns:
-        Content of the fixture file
+        Path to the copied file
 
     """
-    fixture_path = Path(__file__).parent.parent / "fixtures" / fixture_name
-    return fixture_path.read_text()
+    temp_file = temp_dir / "pyproject.toml"
+    temp_file.write_bytes(_fixture_bytes(fixture_name=fixture_name))
+    return temp_file
 
 
 @pytest.mark.parametrize(
@@ -131,14 +200,14 @@ def read_expected_result(*, fixture_name: str) -> str:
 @pytest.mark.usefixtures("mocked_subprocess")
 def test_pyproject_integration(
     *,
-    monkeypatch: pytest.MonkeyPatch,
+    shared_cache_path: Path,
     test_case: str,
     tmp_path: Path,
 ) -> None:
     """Test integration with different pyproject.toml configurations.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
+        shared_cache_path: Session-wide rules cache file
         test_case: The test case name (corresponds to fixture file names)
         tmp_path: Temporary directory fixture from pytest
 
@@ -149,27 +218,15 @@ def test_pyproject_integration(
 
     config_file = copy_fixture_to_temp(fixture_name=before_fixture, temp_dir=tmp_path)
 
-    # Mock sys.argv to simulate running the tool
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-        ],
-    )
-
     # Run the main function
-    result = main()
+    result = main(argv=_argv(config_file=config_file, cache_path=shared_cache_path))
 
     # Should succeed
     assert not result
 
     # Check the result matches expected
-    actual_content = config_file.read_text()
-    expected_content = read_expected_result(fixture_name=after_fixture)
+    actual_content = config_file.read_bytes()
+    expected_content = _fixture_bytes(fixture_name=after_fixture)
 
     assert actual_content.strip() == expected_content.strip()
 
@@ -177,57 +234,43 @@ def test_pyproject_integration(
 @pytest.mark.usefixtures("mocked_subprocess")
 def test_dry_run_integration(
     *,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
+    shared_cache_path: Path,
 ) -> None:
     """Test dry run functionality.
 
+    Dry run must never write, so the tool is pointed at the fixture itself
+    rather than at a copy.
+
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
-        tmp_path: Temporary directory fixture from pytest
+        shared_cache_path: Session-wide rules cache file
 
     """
-    # Copy a before fixture to temp directory
-    config_file = copy_fixture_to_temp(
-        fixture_name="empty_pyproject_before.toml", temp_dir=tmp_path
-    )
-
-    original_content = config_file.read_text()
-
-    # Mock sys.argv to simulate dry run
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-            "--dry-run",
-        ],
-    )
+    fixture_name = "empty_pyproject_before.toml"
+    config_file = _FIXTURES_DIR / fixture_name
+    original_content = _fixture_bytes(fixture_name=fixture_name)
 
     # Run the main function
-    result = main()
+    result = main(
+        argv=_argv("--dry-run", config_file=config_file, cache_path=shared_cache_path)
+    )
 
     # Should succeed
     assert not result
 
     # File should not be modified in dry run
-    current_content = config_file.read_text()
-    assert current_content == original_content
+    assert config_file.read_bytes() == original_content
 
 
 @pytest.mark.usefixtures("mocked_subprocess")
 def test_rule_format_name_integration(
     *,
-    monkeypatch: pytest.MonkeyPatch,
+    shared_cache_path: Path,
     tmp_path: Path,
 ) -> None:
     """Test rule format name functionality with integration.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
+        shared_cache_path: Session-wide rules cache file
         tmp_path: Temporary directory fixture from pytest
 
     """
@@ -236,25 +279,18 @@ def test_rule_format_name_integration(
         fixture_name="existing_pylint_config_before.toml", temp_dir=tmp_path
     )
 
-    # Mock sys.argv to use rule names
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
+    # Run the main function
+    result = main(
+        argv=_argv(
             "--rule-format",
             "name",
             "--rule-comment",
             "none",
-        ],
+            config_file=config_file,
+            cache_path=shared_cache_path,
+        )
     )
 
-    # Run the main function
-    result = main()
-
     # Should succeed
     assert not result
 
@@ -264,305 +300,177 @@ def test_rule_format_name_integration(
     assert "enable" in content  # Should have enable section
 
 
-@pytest.mark.usefixtures("mocked_subprocess")
-def test_rule_comment_none_integration(
-    *,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
-    """Test rule comment none functionality with integration.
+def _check_no_enable_urls(*, content: str) -> None:
+    """Check that no enable array item carries a doc URL comment.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
-        tmp_path: Temporary directory fixture from pytest
+        content: The generated file content.
 
     """
-    # Copy a before fixture to temp directory
-    config_file = copy_fixture_to_temp(
-        fixture_name="existing_pylint_config_before.toml", temp_dir=tmp_path
-    )
+    url_item = _ENABLE_ITEM_URL_RE.search(content)
+    if url_item:
+        pytest.fail(f"Found URL comment in enable section: {url_item.group()}")
 
-    # Mock sys.argv to disable comments
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-            "--rule-comment",
-            "none",
-        ],
-    )
 
-    # Run the main function
-    result = main()
+def _check_all_rules_comment(*, content: str) -> None:
+    """Check that "all" is described and enabled rules have descriptions.
 
-    # Should succeed
-    assert not result
+    Args:
+        content: The generated file content.
 
-    # Check that config file has no URL comments in enable section
-    content = config_file.read_text()
-    lines = content.split("\n")
-    in_enable_section = False
-    for line in lines:
-        if "enable" in line and "=" in line:
-            in_enable_section = True
-        elif line.strip().startswith("["):
-            in_enable_section = False
-        elif in_enable_section and line.strip().startswith('"'):
-            # In enable section, should not have URL comments
-            assert "https://pylint.readthedocs.io" not in line
+    """
+    assert "all" in _disable_list(content=content)
+    assert '"all" # All rules' in content
 
+    # Should also have short descriptions for enabled rules
+    assert "# Invalid constant name" in content or "# invalid name" in content.lower()
 
-@pytest.mark.usefixtures("mocked_subprocess")
-def test_rule_comment_short_description_integration(
-    *,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
-    """Test integration with rule_comment=short_description shows 'All rules' for 'all'.
 
-    Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
-        tmp_path: Temporary directory fixture from pytest.
+def _check_all_without_comment(*, content: str) -> None:
+    """Check that "all" is disabled without the short description comment.
 
-    """
-    # Create a simple config file
-    config_file = tmp_path / "pyproject.toml"
-    config_file.write_text(
-        """[build-system]
-build-backend = "setuptools.build_meta"
-requires = ["setuptools>=45", "wheel"]
+    Any disable rules besides "all" get doc URLs, but the array may be just
+    ["all"], so there is nothing further to require.
 
-[project]
-name = "test-project"
-version = "0.1.0"
-"""
-    )
+    Args:
+        content: The generated file content.
 
-    # Mock sys.argv with rule_comment=short_description
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-            "--rule-comment=short_description",
-        ],
-    )
+    """
+    assert "all" in _disable_list(content=content)
+    assert '"all"' in content
+    assert '"all" # All rules' not in content
 
-    # Run the main function
-    result = main()
-    assert not result
 
-    # Read the result and check for "All rules" comment
-    content = config_file.read_text()
-    assert "disable = [" in content
-    assert '"all" # All rules' in content
+class _RuleCommentCase(NamedTuple):
+    """A rule comment type with its input config and output checks."""
 
-    # Should also have short descriptions for enabled rules
-    assert "# Invalid constant name" in content or "# invalid name" in content.lower()
+    rule_comment: str
+    before: bytes
+    check: Callable[..., None]
 
 
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(
+            _RuleCommentCase(
+                rule_comment="none",
+                before=_fixture_bytes(
+                    fixture_name="existing_pylint_config_before.toml"
+                ),
+                check=_check_no_enable_urls,
+            ),
+            id="none",
+        ),
+        pytest.param(
+            _RuleCommentCase(
+                rule_comment="short_description",
+                before=_SIMPLE_PYPROJECT,
+                check=_check_all_rules_comment,
+            ),
+            id="short_description",
+        ),
+        pytest.param(
+            _RuleCommentCase(
+                rule_comment="doc_url",
+                before=_SIMPLE_PYPROJECT + _DISABLE_W0613,
+                check=_check_all_without_comment,
+            ),
+            id="doc_url_disable_array",
+        ),
+    ],
+)
 @pytest.mark.usefixtures("mocked_subprocess")
-def test_rule_comment_disable_array_with_doc_url(
+def test_rule_comment_integration(
     *,
-    monkeypatch: pytest.MonkeyPatch,
+    case: _RuleCommentCase,
+    shared_cache_path: Path,
     tmp_path: Path,
 ) -> None:
-    """Test that disable array gets doc_url comments when rule_comment=doc_url.
+    """Test each rule comment type end to end.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
-        tmp_path: Temporary directory fixture from pytest.
+        case: The rule comment type, input config and output checks.
+        shared_cache_path: Session-wide rules cache file
+        tmp_path: Temporary directory fixture from pytest
 
     """
-    # Create a config file with some existing disable rules
     config_file = tmp_path / "pyproject.toml"
-    config_file.write_text(
-        """[build-system]
-build-backend = "setuptools.build_meta"
-requires = ["setuptools>=45", "wheel"]
-
-[project]
-name = "test-project"
-version = "0.1.0"
-
-[tool.pylint.messages_control]
-disable = ["W0613"]
-"""
-    )
+    config_file.write_bytes(case.before)
 
-    # Mock sys.argv with default rule_comment=doc_url
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-        ],
+    # Run the main function
+    result = main(
+        argv=_argv(
+            "--rule-comment",
+            case.rule_comment,
+            config_file=config_file,
+            cache_path=shared_cache_path,
+        )
     )
 
-    # Run the main function
-    result = main()
+    # Should succeed
     assert not result
 
-    # Read the result and check for doc URLs in disable array
-    content = config_file.read_text()
-    assert "disable = [" in content
-
-    # Should have "all" without comment (since default is doc_url, not
-    # short_description)
-    assert '"all"' in content
-    assert '"all" # All rules' not in content
-
-    # Should have doc URLs for any disable rules that aren't "all"
-    lines = content.split("\n")
-    disable_section = False
-    for line in lines:
-        if "disable = [" in line:
-            disable_section = True
-        elif disable_section and "]" in line:
-            disable_section = False
-        elif disable_section and "https://pylint.readthedocs.io" in line:
-            # Found a doc URL in the disable section
-            break
-    else:
-        # If we have actual rules in disable array besides "all", they should
-        # have doc URLs. But if it's just ["all"], that's fine too
-        pass
+    case.check(content=config_file.read_text())
 
 
 @pytest.mark.usefixtures("mocked_subprocess")
 def test_rule_comment_none_no_comments_in_disable(
     *,
-    monkeypatch: pytest.MonkeyPatch,
+    shared_cache_path: Path,
     tmp_path: Path,
 ) -> None:
     """Test that disable array has no comments when rule_comment=none.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
+        shared_cache_path: Session-wide rules cache file
         tmp_path: Temporary directory fixture from pytest.
 
     """
     # Create a config file
     config_file = tmp_path / "pyproject.toml"
-    config_file.write_text(
-        """[build-system]
-build-backend = "setuptools.build_meta"
-requires = ["setuptools>=45", "wheel"]
-
-[project]
-name = "test-project"
-version = "0.1.0"
-"""
-    )
-
-    # Mock sys.argv with rule_comment=none
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-            "--rule-comment=none",
-        ],
-    )
+    config_file.write_bytes(_SIMPLE_PYPROJECT)
 
     # Run the main function
-    result = main()
+    result = main(
+        argv=_argv(
+            "--rule-comment=none", config_file=config_file, cache_path=shared_cache_path
+        )
+    )
     assert not result
 
     # Read the result and verify no comments
     content = config_file.read_text()
 
     # Should not have any # comments in the pylint section
-    lines = content.split("\n")
-    in_pylint = False
-    for line in lines:
-        if "[tool.pylint" in line:
-            in_pylint = True
-        elif in_pylint and line.startswith("[") and "pylint" not in line:
-            in_pylint = False
-        elif in_pylint and "#" in line:
-            # Should not have comments in pylint section
-            pytest.fail(f"Found unexpected comment in pylint section: {line}")
-
-
-@pytest.mark.usefixtures("mocked_subprocess")
-def test_file_not_found_error(
-    *,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
-    """Test error handling when config file doesn't exist.
-
-    Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
-        tmp_path: Temporary directory fixture from pytest
-
-    """
-    non_existent_file = tmp_path / "non_existent.toml"
-
-    # Mock sys.argv to simulate file not found
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(non_existent_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-        ],
-    )
-
-    # Run the main function
-    result = main()
-
-    # Should return error code
-    assert result == 1
+    section = _PYLINT_SECTIONS_RE.search(content)
+    if section and "#" in section.group():
+        comment = _COMMENT_LINE_RE.search(content, *section.span())
+        if comment:
+            pytest.fail(
+                f"Found unexpected comment in pylint section: {comment.group()}"
+            )
 
 
 @pytest.mark.usefixtures("mocked_subprocess")
 def test_invalid_config_file(
     *,
-    monkeypatch: pytest.MonkeyPatch,
+    shared_cache_path: Path,
     tmp_path: Path,
 ) -> None:
     """Test error handling with invalid config file.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
+        shared_cache_path: Session-wide rules cache file
         tmp_path: Temporary directory fixture from pytest
 
     """
     # Create an invalid TOML file
     invalid_config = tmp_path / "invalid.toml"
-    invalid_config.write_text("This is not valid TOML content [[[")
-
-    # Mock sys.argv to simulate invalid config
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(invalid_config),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
-        ],
-    )
+    invalid_config.write_bytes(b"This is not valid TOML content [[[")
 
     # Run the main function
-    result = main()
+    result = main(argv=_argv(config_file=invalid_config, cache_path=shared_cache_path))
 
     # Should return error code (1 for general errors)
     assert result == 1
@@ -586,17 +494,17 @@ def test_invalid_config_file(
 @pytest.mark.usefixtures("mocked_subprocess")
 def test_all_rule_format_comment_combinations(
     *,
-    monkeypatch: pytest.MonkeyPatch,
     rule_comment: str,
     rule_format: str,
+    shared_cache_path: Path,
     tmp_path: Path,
 ) -> None:
     """Test all combinations of rule-format and rule-comment parameters.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
         rule_comment: The rule comment type to test.
         rule_format: The rule format type to test.
+        shared_cache_path: Session-wide rules cache file
         tmp_path: Temporary directory fixture from pytest.
 
     """
@@ -605,25 +513,18 @@ def test_all_rule_format_comment_combinations(
         fixture_name="existing_pylint_config_before.toml", temp_dir=tmp_path
     )
 
-    # Mock sys.argv with the specific combination
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
+    # Run the main function
+    result = main(
+        argv=_argv(
             "--rule-format",
             rule_format,
             "--rule-comment",
             rule_comment,
-        ],
+            config_file=config_file,
+            cache_path=shared_cache_path,
+        )
     )
 
-    # Run the main function
-    result = main()
-
     # Should succeed
     assert not result
 
@@ -650,18 +551,18 @@ def test_all_rule_format_comment_combinations(
 @pytest.mark.usefixtures("mocked_subprocess")
 def test_case_insensitive_sorting(
     *,
-    monkeypatch: pytest.MonkeyPatch,
+    shared_cache_path: Path,
     tmp_path: Path,
 ) -> None:
     """Test that rule arrays are sorted case-insensitively.
 
     Args:
-        monkeypatch: Pytest monkeypatch fixture for mocking.
+        shared_cache_path: Session-wide rules cache file
         tmp_path: Temporary directory fixture from pytest.
 
     """
     # Create a simple config file with just a few mixed-case rule identifiers
-    test_config = """[build-system]
+    test_config = b"""[build-system]
 build-backend = "setuptools.build_meta"
 requires = ["setuptools>=45", "wheel"]
 
@@ -675,43 +576,25 @@ disable = ["zebra-rule", "Apple-rule", "bear-rule", "all"]
 """
 
     config_file = tmp_path / "pyproject.toml"
-    config_file.write_text(test_config)
-
-    # Mock sys.argv
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "pylint-ruff-sync",
-            "--config-file",
-            str(config_file),
-            "--cache-path",
-            str(tmp_path / "test_cache.json"),
+    config_file.write_bytes(test_config)
+
+    # Run the main function
+    result = main(
+        argv=_argv(
             "--rule-format",
             "code",
             "--rule-comment",
             "none",
-        ],
+            config_file=config_file,
+            cache_path=shared_cache_path,
+        )
     )
 
-    # Run the main function
-    result = main()
-
     # Should succeed
     assert not result
 
-    # Read the generated content
-    content = config_file.read_text()
-
-    # Extract all quoted items from disable array using regex
-
-    disable_section_match = re.search(r"disable\s*=\s*\[(.*?)\]", content, re.DOTALL)
-
-    assert disable_section_match, "Could not find disable array"
-
-    disable_content = disable_section_match.group(1)
-
-    # Extract quoted items
-    quoted_items = re.findall(r'"([^"]*)"', disable_content)
+    # Read the items of the generated disable array
+    quoted_items = _disable_list(content=config_file.read_text())
 
     # Verify case-insensitive sorting
     # Expected order (case-insensitive): "all", "Apple-rule", "bear-rule", "zebra-rule"
@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from pylint_ruff_sync.constants import RUFF_PYLINT_ISSUE_URL
-from pylint_ruff_sync.main import _setup_argument_parser, main
+from pylint_ruff_sync.main import Application, _setup_argument_parser, main
 from pylint_ruff_sync.pylint_extractor import PylintExtractor
 from pylint_ruff_sync.pyproject_updater import PyprojectUpdater
 from pylint_ruff_sync.ruff_pylint_extractor import RuffPylintExtractor
@@ -299,6 +299,21 @@ disable = [
     assert "disable" in updated_content
 
 
+def test_run_missing_config_file(*, tmp_path: Path) -> None:
+    """Test that a missing config file fails before any rules are loaded.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    parser = _setup_argument_parser()
+    args = parser.parse_args(["--config-file", str(tmp_path / "missing.toml")])
+    app = Application(args=args)
+
+    assert app.run() == 1
+    assert app._rules is None
+
+
 def test_ruff_extractor_initialization() -> None:
     """Test that RuffPylintExtractor can be initialized with a Rules object."""
     rules = Rules()
@@ -7,8 +7,9 @@ managing TOML files with proper section handling and comment preservation.
 from __future__ import annotations
 
 import tempfile
+import tomllib
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -16,11 +17,13 @@ from pylint_ruff_sync.toml_file import (
     MAX_LINE_LENGTH,
     SimpleArrayWithComments,
     TomlFile,
+    _build_toml_sort,
+    apply_toml_sort_library,
+    apply_toml_sort_subprocess,
 )
-from tests.constants import TOML_SORT_MIN_ARGS
 
 if TYPE_CHECKING:
-    import pytest
+    from toml_sort.tomlsort import TomlSort
 
     from tests.conftest import TomlSortMockProtocol
 
@@ -47,6 +50,178 @@ def test_init_nonexistent_file() -> None:
     assert toml_file.as_dict() == {}
 
 
+def test_load_file_cached_until_modified(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that an unchanged file is only read once across instances.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nkey = "value"\n', encoding="utf-8")
+
+    reads: list[Path] = []
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        reads.append(self)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    first = TomlFile(file_path=temp_file)
+    second = TomlFile(file_path=temp_file)
+    assert first.as_str() == second.as_str()
+    assert len(reads) == 1
+
+    # Changing the file size invalidates the cached content
+    temp_file.write_text('[tool.test]\nkey = "changed"\n', encoding="utf-8")
+    third = TomlFile(file_path=temp_file)
+    assert "changed" in third.as_str()
+    expected_reads = 2
+    assert len(reads) == expected_reads
+
+
+def test_load_file_normalizes_newlines(*, tmp_path: Path) -> None:
+    """Test that CRLF and CR line endings load as LF, as with read_text.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_bytes(b'[tool.test]\r\nkey = "value"\rother = 1\n')
+
+    toml_file = TomlFile(file_path=temp_file)
+
+    assert toml_file.as_str() == '[tool.test]\nkey = "value"\nother = 1\n'
+
+
+def test_write_caches_sorted_content(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that reloading a just-written file reuses the written content.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    toml_file = TomlFile(file_path=tmp_path / "test.toml")
+    toml_file.update_section_array(
+        array_data=["C0103"], key="enable", section_path="tool.test"
+    )
+    toml_file.write()
+
+    def failing_read_bytes(self: Path) -> bytes:
+        msg = f"unexpected read of {self}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(Path, "read_bytes", failing_read_bytes)
+
+    reloaded = TomlFile(file_path=toml_file.file_path)
+    assert reloaded.as_str() == toml_file.as_str()
+    assert reloaded.as_dict()["tool"]["test"]["enable"] == ["C0103"]
+
+
+def test_write_skipped_when_unchanged(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that write() leaves the file alone when nothing changed.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nkey = "value"\n', encoding="utf-8")
+
+    writes: list[Path] = []
+    original_write_bytes = Path.write_bytes
+
+    def counting_write_bytes(self: Path, data: bytes) -> int:
+        writes.append(self)
+        return original_write_bytes(self, data)
+
+    monkeypatch.setattr(Path, "write_bytes", counting_write_bytes)
+
+    toml_file = TomlFile(file_path=temp_file)
+    toml_file.write()
+    assert not writes
+
+    toml_file.update_section_array(
+        array_data=["C0103"], key="enable", section_path="tool.test"
+    )
+    toml_file.write()
+    toml_file.write()
+    assert writes == [temp_file]
+
+
+def test_get_section_array(*, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test reading one array without parsing the whole file.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text(
+        "[tool.pylint.messages_control]\n"
+        'enable = ["C0103"]\n'
+        "disable = [\n"
+        '  "all", # everything\n'
+        '  "E0401"\n'
+        "]\n"
+        "\n"
+        "[tool.other]\n"
+        'other = ["x"]\n',
+        encoding="utf-8",
+    )
+    toml_file = TomlFile(file_path=temp_file)
+
+    def failing_as_dict() -> dict[str, object]:
+        msg = "unexpected full parse"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(toml_file, "as_dict", failing_as_dict)
+    section_path = "tool.pylint.messages_control"
+    assert toml_file.get_section_array(key="disable", section_path=section_path) == [
+        "all",
+        "E0401",
+    ]
+    assert toml_file.get_section_array(key="enable", section_path=section_path) == [
+        "C0103"
+    ]
+    monkeypatch.undo()
+
+    # Keys in later sections and missing keys are not picked up
+    assert toml_file.get_section_array(key="other", section_path=section_path) is None
+    assert toml_file.get_section_array(key="other", section_path="tool.other") == ["x"]
+
+
+def test_get_section_array_dotted_key(*, tmp_path: Path) -> None:
+    """Test that arrays defined as dotted keys fall back to a full parse.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text(
+        '[tool.pylint]\nmessages_control.disable = ["all"]\n', encoding="utf-8"
+    )
+    toml_file = TomlFile(file_path=temp_file)
+
+    assert toml_file.get_section_array(
+        key="disable", section_path="tool.pylint.messages_control"
+    ) == ["all"]
+
+
 def test_as_dict_existing_file() -> None:
     """Test as_dict method with existing file."""
     with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".toml") as f:
@@ -61,6 +236,34 @@ def test_as_dict_existing_file() -> None:
         temp_path.unlink()
 
 
+def test_as_dict_parsed_once_until_modified(*, tmp_path: Path) -> None:
+    """Test that as_dict reuses the parsed result until the content changes.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nkey = "value"\n', encoding="utf-8")
+
+    toml_file = TomlFile(file_path=temp_file)
+    first = toml_file.as_dict()
+    assert toml_file.as_dict() is first
+
+    toml_file.update_section_array(
+        array_data=["item1"],
+        key="items",
+        section_path="tool.test",
+    )
+    updated = toml_file.as_dict()
+    assert updated is not first
+    assert updated["tool"]["test"]["items"] == ["item1"]
+
+    # Sorting the pending edits does not change the data, so the cache holds
+    toml_file.as_str()
+    assert toml_file.as_dict() is updated
+
+
 def test_as_dict_empty_file() -> None:
     """Test as_dict method with empty file."""
     with tempfile.NamedTemporaryFile(delete=False, suffix=".toml") as f:
@@ -74,6 +277,21 @@ def test_as_dict_empty_file() -> None:
         temp_path.unlink()
 
 
+def test_as_dict_invalid_toml_raises_decode_error(*, tmp_path: Path) -> None:
+    """Test that invalid TOML raises the stdlib error whichever parser is used.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text("This is not valid TOML content [[[", encoding="utf-8")
+    toml_file = TomlFile(file_path=temp_file)
+
+    with pytest.raises(tomllib.TOMLDecodeError):
+        toml_file.as_dict()
+
+
 def test_as_str() -> None:
     """Test as_str method."""
     with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".toml") as f:
@@ -167,6 +385,33 @@ def test_update_section_array_empty_list() -> None:
         temp_path.unlink()
 
 
+def test_update_section_arrays(*, tmp_path: Path) -> None:
+    """Test updating several arrays in one section with a single edit.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text(
+        '[tool.pylint.messages_control]\ndisable = ["old"]\n', encoding="utf-8"
+    )
+
+    toml_file = TomlFile(file_path=temp_file)
+    toml_file.update_section_arrays(
+        arrays={
+            "disable": SimpleArrayWithComments(items=["all"]),
+            "enable": ["C0103", "W0613"],
+        },
+        section_path="tool.pylint.messages_control",
+    )
+
+    assert toml_file.as_dict()["tool"]["pylint"]["messages_control"] == {
+        "disable": ["all"],
+        "enable": ["C0103", "W0613"],
+    }
+
+
 def test_write() -> None:
     """Test writing the file to disk."""
     with tempfile.NamedTemporaryFile(delete=False, suffix=".toml") as f:
@@ -192,6 +437,140 @@ def test_write() -> None:
         temp_path.unlink()
 
 
+def test_toml_sort_applied_once_for_multiple_edits(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that several edits are sorted with a single toml-sort run.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    sort_calls: list[str] = []
+
+    def counting_sort(*, content: str, working_directory: Path) -> str:
+        assert working_directory == tmp_path
+        sort_calls.append(content)
+        return content
+
+    monkeypatch.setattr(
+        "pylint_ruff_sync.toml_file.apply_toml_sort_library", counting_sort
+    )
+
+    toml_file = TomlFile(file_path=tmp_path / "test.toml")
+    toml_file.update_section_array(
+        array_data=["all"], key="disable", section_path="tool.test"
+    )
+    toml_file.update_section_array(
+        array_data=["C0103"], key="enable", section_path="tool.test"
+    )
+    assert toml_file.as_dict()["tool"]["test"] == {
+        "disable": ["all"],
+        "enable": ["C0103"],
+    }
+    assert not sort_calls
+
+    toml_file.write()
+    toml_file.write()
+    assert len(sort_calls) == 1
+
+
+def test_update_section_arrays_unchanged_values(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that rewriting keys with their current values skips toml-sort.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    sort_calls: list[str] = []
+
+    def counting_sort(*, content: str, working_directory: Path) -> str:
+        assert working_directory == tmp_path
+        sort_calls.append(content)
+        return content
+
+    monkeypatch.setattr(
+        "pylint_ruff_sync.toml_file.apply_toml_sort_library", counting_sort
+    )
+
+    temp_file = tmp_path / "test.toml"
+    original = '[tool.test]\ndisable = ["all"]\nenable = [\n  "C0103" # name\n]\n'
+    temp_file.write_text(original, encoding="utf-8")
+    toml_file = TomlFile(file_path=temp_file)
+
+    toml_file.update_section_arrays(
+        arrays={
+            "disable": ["all"],
+            "enable": SimpleArrayWithComments(
+                comments={"C0103": "name"}, items=["C0103"]
+            ),
+        },
+        section_path="tool.test",
+    )
+    assert toml_file.as_str() == original
+    assert not sort_calls
+
+    toml_file.update_section_arrays(
+        arrays={"disable": ["all"], "enable": ["C0111"]},
+        section_path="tool.test",
+    )
+    assert toml_file.as_dict()["tool"]["test"] == {
+        "disable": ["all"],
+        "enable": ["C0111"],
+    }
+    toml_file.as_str()
+    assert len(sort_calls) == 1
+
+
+def test_write_many(*, tmp_path: Path) -> None:
+    """Test writing several files concurrently.
+
+    Args:
+        tmp_path: Temporary path for the test files.
+
+    """
+    toml_files = []
+    for name in ("first", "second", "third"):
+        toml_file = TomlFile(file_path=tmp_path / f"{name}.toml")
+        toml_file.update_section_array(
+            array_data=[name],
+            key="items",
+            section_path=f"tool.{name}",
+        )
+        toml_files.append(toml_file)
+
+    TomlFile.write_many(files=toml_files)
+
+    for toml_file in toml_files:
+        assert toml_file.file_path.read_text(encoding="utf-8") == toml_file.as_str()
+
+
+def test_load_many(*, tmp_path: Path) -> None:
+    """Test loading several files concurrently.
+
+    Args:
+        tmp_path: Temporary path for the test files.
+
+    """
+    file_paths = []
+    for name in ("first", "second", "third"):
+        file_path = tmp_path / f"{name}.toml"
+        file_path.write_text(f'[tool.{name}]\nitems = ["{name}"]\n', encoding="utf-8")
+        file_paths.append(file_path)
+    file_paths.append(tmp_path / "missing.toml")
+
+    toml_files = TomlFile.load_many(file_paths=file_paths)
+
+    assert [toml_file.file_path for toml_file in toml_files] == file_paths
+    for name, toml_file in zip(("first", "second", "third"), toml_files, strict=False):
+        assert toml_file.as_dict() == {"tool": {name: {"items": [name]}}}
+    assert not toml_files[-1].as_str()
+
+
 def test_simple_array_with_comments_format_empty() -> None:
     """Test SimpleArrayWithComments formatting with empty array."""
     array_with_comments = SimpleArrayWithComments(comments=None, items=[])
@@ -230,6 +609,30 @@ def test_simple_array_with_comments_format_partial_comments() -> None:
     assert result == expected
 
 
+def test_simple_array_with_comments_format_escapes_comments() -> None:
+    """Test SimpleArrayWithComments escapes control characters in comments."""
+    array_with_comments = SimpleArrayWithComments(
+        comments={"item1": "line1\nline2\r\ttabbed"},
+        items=["item1"],
+    )
+    result = array_with_comments.format_as_toml()
+    expected = '[\n  "item1" # line1\\nline2\\r\\ttabbed\n]'
+    assert result == expected
+
+
+def test_simple_array_single_line_length_boundary() -> None:
+    """Test the single-line length check at exactly MAX_LINE_LENGTH."""
+    # Two items add brackets, four quotes and one ", " separator: 8 characters
+    first = "a" * 40
+    at_limit = SimpleArrayWithComments(items=[first, "b" * (MAX_LINE_LENGTH - 48)])
+    over_limit = SimpleArrayWithComments(items=[first, "b" * (MAX_LINE_LENGTH - 47)])
+
+    single_line = at_limit.format_as_toml()
+    assert "\n" not in single_line
+    assert len(single_line) == MAX_LINE_LENGTH
+    assert over_limit.format_as_toml().startswith("[\n")
+
+
 def test_simple_array_multiline_due_to_length() -> None:
     """Test SimpleArrayWithComments formatting goes multiline when exceeding 88."""
     # Create an array that would exceed 88 characters in single-line format
@@ -305,6 +708,116 @@ def test_apply_toml_sort() -> None:
         temp_path.unlink()
 
 
+def test_apply_toml_sort_library_matches_cli(*, tmp_path: Path) -> None:
+    """Test that in-process sorting honours [tool.tomlsort] like the CLI does.
+
+    Args:
+        tmp_path: Temporary path holding the pyproject.toml with settings.
+
+    """
+    content = """[tool.tomlsort]
+sort_table_keys = true
+spaces_before_inline_comment = 2
+
+[tool.z]
+b = 1
+a = 2 # inline
+
+[tool.a]
+items = [
+  "Zeta",
+  "alpha" # comment
+]
+"""
+    (tmp_path / "pyproject.toml").write_text(content, encoding="utf-8")
+
+    library_result = apply_toml_sort_library(
+        content=content, working_directory=tmp_path
+    )
+    cli_result = apply_toml_sort_subprocess(content=content, working_directory=tmp_path)
+
+    assert library_result == cli_result
+    assert "a = 2  # inline" in library_result
+
+
+def test_apply_toml_sort_library_memoized(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that sorting the same content with the same settings is memoized.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary directory holding the pyproject.toml.
+
+    """
+    builds: list[dict[str, Any]] = []
+
+    def counting_build(*, content: str, settings: dict[str, Any]) -> TomlSort:
+        builds.append(settings)
+        return _build_toml_sort(content=content, settings=settings)
+
+    monkeypatch.setattr("pylint_ruff_sync.toml_file._build_toml_sort", counting_build)
+
+    content = f"[tool.z{tmp_path.name}]\nb = 1\n\n[tool.a]\na = 1\n"
+    first = apply_toml_sort_library(content=content, working_directory=tmp_path)
+    second = apply_toml_sort_library(content=content, working_directory=tmp_path)
+    assert first == second
+    assert len(builds) == 1
+
+    # Changing the toml-sort settings sorts the content again
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.tomlsort]\nno_sort_tables = true\n", encoding="utf-8"
+    )
+    third = apply_toml_sort_library(content=content, working_directory=tmp_path)
+    assert third == content
+    expected_builds = 2
+    assert len(builds) == expected_builds
+
+
+@pytest.mark.parametrize("in_place", [False, True])
+def test_apply_toml_sort_subprocess(*, in_place: bool, tmp_path: Path) -> None:
+    """Test the toml-sort CLI via stdin and via an in-place temporary file.
+
+    Args:
+        in_place: Whether the user's configuration enables in_place.
+        tmp_path: Temporary directory holding the pyproject.toml.
+
+    """
+    (tmp_path / "pyproject.toml").write_text(
+        f"[tool.tomlsort]\nin_place = {str(in_place).lower()}\n", encoding="utf-8"
+    )
+    content = "[tool.z]\nb = 1\n\n[tool.a]\na = 1\n"
+    expected = "[tool.a]\na = 1\n\n[tool.z]\nb = 1\n"
+
+    result = apply_toml_sort_subprocess(content=content, working_directory=tmp_path)
+    assert result == expected
+    # Already sorted content makes the CLI print nothing on stdout
+    result = apply_toml_sort_subprocess(content=expected, working_directory=tmp_path)
+    assert result == expected
+
+
+def test_apply_toml_sort_subprocess_uses_no_temp_file(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that the stdout mode never creates or reads back a temporary file.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary directory used as the working directory.
+
+    """
+
+    def failing_temp_file(*_args: object, **_kwargs: object) -> None:
+        msg = "unexpected temporary file"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", failing_temp_file)
+
+    content = "[tool.z]\nb = 1\n\n[tool.a]\na = 1\n"
+    result = apply_toml_sort_subprocess(content=content, working_directory=tmp_path)
+    assert result == "[tool.a]\na = 1\n\n[tool.z]\nb = 1\n"
+
+
 def test_add_key_to_new_section() -> None:
     """Test adding a key to a completely new section."""
     with tempfile.NamedTemporaryFile(delete=False, suffix=".toml") as f:
@@ -660,12 +1173,12 @@ def test_toml_sort_with_custom_configuration(
 
     """
 
-    def mock_subprocess_run(*args: object, **_kwargs: object) -> object:
+    def mock_subprocess_run(*args: object, **kwargs: object) -> object:
         """Mock subprocess.run to intercept toml-sort calls.
 
         Args:
             *args: Arguments passed to subprocess.run.
-            **_kwargs: Keyword arguments passed to subprocess.run (unused).
+            **kwargs: Keyword arguments passed to subprocess.run.
 
         Returns:
             Mock subprocess result.
@@ -674,9 +1187,9 @@ def test_toml_sort_with_custom_configuration(
 
         # Create a mock result object for subprocess.run
         class MockResult:
-            def __init__(self) -> None:
+            def __init__(self, *, stdout: str = "") -> None:
                 self.returncode = 0
-                self.stdout = ""
+                self.stdout = stdout
                 self.stderr = ""
 
         # Check if this is a toml-sort command
@@ -685,20 +1198,19 @@ def test_toml_sort_with_custom_configuration(
             and len(args) > 0
             and isinstance(args[0], list)
             and len(args[0]) > 0
-            and args[0][0] == "toml-sort"
+            and Path(args[0][0]).name == "toml-sort"
         ):
-            # Handle toml-sort subprocess call
+            # Handle toml-sort subprocess call, piped through stdin
             command_args = args[0]
-            if "--in-place" in command_args and len(command_args) >= TOML_SORT_MIN_ARGS:
-                file_path = command_args[2]
+            if command_args[-1] == "-":
                 # Use the fixture to apply the mock
-                toml_sort_mock(file_path=file_path)
-                return MockResult()
+                return MockResult(stdout=toml_sort_mock(content=str(kwargs["input"])))
 
         return MockResult()
 
-    # Monkeypatch the subprocess function
+    # Monkeypatch the subprocess function and route toml-sort through it
     monkeypatch.setattr("subprocess.run", mock_subprocess_run)
+    monkeypatch.setattr("pylint_ruff_sync.toml_file._HAS_TOML_SORT", False)
 
     # Test content with unsorted sections
     toml_content = """[tool.z]
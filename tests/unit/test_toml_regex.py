@@ -244,6 +244,49 @@ line-length = 88
     assert "[tool.black]" not in section_content
 
 
+def test_build_section_content_pattern_is_cached() -> None:
+    """Test that section content patterns are compiled once per section path."""
+    regex = TomlRegex()
+
+    first = regex.build_section_content_pattern(section_path="tool.pylint")
+    second = TomlRegex().build_section_content_pattern(section_path="tool.pylint")
+    other = regex.build_section_content_pattern(section_path="tool.ruff")
+
+    assert first is second
+    assert first is not other
+
+
+def test_build_section_and_key_exists_patterns_are_cached() -> None:
+    """Test that section header and key existence patterns are compiled once."""
+    regex = TomlRegex()
+
+    section = regex.build_section_pattern(section_path="tool.pylint")
+    assert section is TomlRegex().build_section_pattern(section_path="tool.pylint")
+    assert section is not regex.build_section_pattern(section_path="tool.ruff")
+
+    key = regex.build_key_exists_in_section_pattern(key="disable")
+    assert key is TomlRegex().build_key_exists_in_section_pattern(key="disable")
+    assert key is not regex.build_key_exists_in_section_pattern(key="enable")
+
+
+def test_build_key_in_section_pattern_is_cached() -> None:
+    """Test that key patterns are compiled once per key and section path."""
+    regex = TomlRegex()
+
+    first = regex.build_key_in_section_pattern(key="disable", section_path="tool.a")
+    second = TomlRegex().build_key_in_section_pattern(
+        key="disable", section_path="tool.a"
+    )
+    other_key = regex.build_key_in_section_pattern(key="enable", section_path="tool.a")
+    other_section = regex.build_key_in_section_pattern(
+        key="disable", section_path="tool.b"
+    )
+
+    assert first is second
+    assert first is not other_key
+    assert first is not other_section
+
+
 def test_find_section_header() -> None:
     """Test the find_section_header method."""
     regex = TomlRegex()
@@ -386,6 +429,29 @@ def test_replace_key_in_section() -> None:
         assert next_line == 'enable = ["rule2"]'  # Should be properly separated
 
 
+def test_replace_key_in_section_with_indented_boundaries() -> None:
+    """Test replacement stops at indented keys after blank lines."""
+    regex = TomlRegex()
+
+    toml_content = (
+        "[tool.pylint.messages_control]\n"
+        'disable = ["old-rule"]\n'
+        "\n\n\n"
+        '    enable = ["rule2"]\n'
+    )
+
+    result = regex.replace_key_in_section(
+        content=toml_content,
+        key="disable",
+        new_value='["new-rule"]',
+        section_path="tool.pylint.messages_control",
+    )
+
+    assert 'disable = ["new-rule"]\n' in result
+    assert '    enable = ["rule2"]' in result
+    assert "old-rule" not in result
+
+
 def test_replace_key_in_section_not_found() -> None:
     """Test replacing a key that doesn't exist raises ValueError."""
     regex = TomlRegex()
@@ -666,3 +732,150 @@ def test_regex_performance_with_large_content() -> None:
         section_path="tool.pylint.messages_control",
     )
     assert 'disable = ["new-target-rule"]' in result
+
+
+def test_replace_key_in_section_with_long_multiline_value() -> None:
+    """Test replacing a value spanning many lines without a boundary."""
+    items = "".join(f'    "rule-{i}",\n' for i in range(10_000))
+    toml_content = (
+        "[tool.pylint.messages_control]\n"
+        f"disable = [\n{items}]\n"
+        'enable = ["other-rule"]\n'
+    )
+
+    result = TOML_REGEX.replace_key_in_section(
+        content=toml_content,
+        key="disable",
+        new_value='["new-rule"]',
+        section_path="tool.pylint.messages_control",
+    )
+
+    assert result == (
+        "[tool.pylint.messages_control]\n"
+        'disable = ["new-rule"]\n'
+        'enable = ["other-rule"]\n'
+    )
+
+
+def test_replace_key_in_section_ignores_later_sections() -> None:
+    """Test that a key missing from its section is not matched further down."""
+    regex = TomlRegex()
+
+    toml_content = IndentedMultiline("""
+        [tool.pylint.messages_control]
+        enable = ["rule1"]
+
+        [tool.ruff]
+        disable = ["other-rule"]
+        """)
+
+    result = regex.find_key_in_section(
+        content=toml_content, key="disable", section_path="tool.pylint.messages_control"
+    )
+    assert not result.matched
+
+    with pytest.raises(ValueError, match="Key 'disable' not found in section"):
+        regex.replace_key_in_section(
+            content=toml_content,
+            key="disable",
+            new_value='["new-rule"]',
+            section_path="tool.pylint.messages_control",
+        )
+
+
+def test_scan() -> None:
+    """Test that scan maps each section's keys to their value spans."""
+    regex = TomlRegex()
+
+    toml_content = IndentedMultiline("""
+        top = 1
+
+        [tool.pylint.messages_control]
+        disable = [
+          "rule1",  # comment
+        ]
+
+        max-line-length = 100
+
+        [[tool.array]]
+        disable = ["ignored"]
+
+        [tool.ruff]
+        disable = ["other-rule"]
+        """)
+
+    sections = regex.scan(toml_content)
+
+    assert set(sections) == {"", "tool.pylint.messages_control", "tool.ruff"}
+    assert list(sections["tool.pylint.messages_control"]) == [
+        "disable",
+        "max-line-length",
+    ]
+
+    start, end = sections["tool.pylint.messages_control"]["disable"]
+    assert toml_content[start:end] == 'disable = [\n  "rule1",  # comment\n]\n'
+    start, end = sections["tool.ruff"]["disable"]
+    assert toml_content[start:end] == 'disable = ["other-rule"]\n'
+    start, end = sections[""]["top"]
+    assert toml_content[start:end] == "top = 1\n"
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ('disable = ["rule1"]', True),
+        ('disable=["rule1"]', True),
+        ('    disable   = ["rule1"]', True),
+        ('disable_extra = ["rule1"]', False),
+        ('# disable = ["rule1"]', False),
+        ('enable = ["disable"]', False),
+    ],
+)
+def test_key_exists_in_section_line_forms(*, line: str, expected: bool) -> None:
+    """Test key existence across whitespace variants and near misses.
+
+    Args:
+        line: The line placed in the section.
+        expected: Whether the disable key should be found.
+
+    """
+    toml_content = f"[tool.pylint.messages_control]\n{line}\n"
+
+    assert (
+        TOML_REGEX.key_exists_in_section(
+            content=toml_content,
+            key="disable",
+            section_path="tool.pylint.messages_control",
+        )
+        is expected
+    )
+
+
+def test_batch_edit_matches_sequential_edits() -> None:
+    """Test that batch_edit gives the same result as one edit at a time."""
+    regex = TomlRegex()
+
+    toml_content = IndentedMultiline("""
+        [tool.pylint.messages_control]
+        disable = [
+          "old-rule",
+        ]
+
+        [tool.ruff]
+        line-length = 88
+        """)
+    edits = [
+        ("tool.pylint.messages_control", "disable", '["new-rule"]'),
+        ("tool.new", "first", '"a"'),
+        ("tool.pylint.messages_control", "enable", '["other-rule"]'),
+        ("tool.new", "second", '"b"'),
+        ("tool.pylint.messages_control", "disable", '["final-rule"]'),
+    ]
+
+    expected: str = toml_content
+    for section_path, key, value in edits:
+        expected = regex.add_key_to_section(
+            content=expected, key=key, section_path=section_path, value=value
+        )
+
+    assert regex.batch_edit(toml_content, edits) == expected